@@ -1,7 +1,8 @@
 use nanobook::itch::{ItchMessage, ItchParser};
 use nanobook::{Exchange, OrderId, Price, PriceLevels, Side, TimeInForce};
+use rustc_hash::FxHashMap;
 use serde_json::json;
-use std::collections::{HashMap, HashSet};
+use std::collections::HashSet;
 use std::fs::{File, create_dir_all};
 use std::io::{self, BufReader, BufWriter, Error, ErrorKind, Write};
 use std::path::{Path, PathBuf};
@@ -149,9 +150,11 @@ fn usage() -> &'static str {
 }
 
 struct Replay {
-    exchanges: HashMap<String, Exchange>,
-    orders: HashMap<u64, RestingOrder>,
-    last_timestamp_by_symbol: HashMap<String, u64>,
+    exchanges: FxHashMap<String, Exchange>,
+    /// Resting orders by ITCH order reference, probed on every execute,
+    /// cancel, delete, and replace.
+    orders: FxHashMap<u64, RestingOrder>,
+    last_timestamp_by_symbol: FxHashMap<String, u64>,
     event_log: BufWriter<File>,
     invariant_log: BufWriter<File>,
     summary: BufWriter<File>,
@@ -164,9 +167,9 @@ struct Replay {
 impl Replay {
     fn new(output_dir: &Path, warmup_events: u64, snapshot_every: u64) -> io::Result<Self> {
         Ok(Self {
-            exchanges: HashMap::new(),
-            orders: HashMap::new(),
-            last_timestamp_by_symbol: HashMap::new(),
+            exchanges: FxHashMap::default(),
+            orders: FxHashMap::default(),
+            last_timestamp_by_symbol: FxHashMap::default(),
             event_log: BufWriter::new(File::create(output_dir.join("event-log.jsonl"))?),
             invariant_log: BufWriter::new(File::create(output_dir.join("invariants.log"))?),
             summary: BufWriter::new(File::create(output_dir.join("summary.txt"))?),
@@ -1,6 +1,7 @@
 from typing import List, Tuple, Optional, Dict, Any, Union, Callable
 
 __version__: str
+EVENT_KINDS: List[str]
 
 class IbkrBroker:
     def __init__(self, host: str, port: int, client_id: int) -> None: ...
@@ -86,6 +87,8 @@ class BookSnapshot:
     def bids(self) -> List[LevelSnapshot]: ...
     @property
     def asks(self) -> List[LevelSnapshot]: ...
+    def bids_np(self) -> Any: ...
+    def asks_np(self) -> Any: ...
     def imbalance(self) -> Optional[float]: ...
     def weighted_mid(self) -> Optional[float]: ...
     def mid_price(self) -> Optional[float]: ...
@@ -146,7 +149,7 @@ class CostModel:
     def compute_cost(self, notional: int) -> int: ...
 
 class Portfolio:
-    def __init__(self, initial_cash: int, cost_model: CostModel) -> None: ...
+    def __init__(self, initial_cash: int, cost_model: CostModel, capacity: int = 0) -> None: ...
     @property
     def cash(self) -> int: ...
     def position(self, symbol: str) -> Optional[Position]: ...
@@ -154,20 +157,30 @@ class Portfolio:
     def total_equity(self, prices: List[Tuple[str, int]]) -> int: ...
     def current_weights(self, prices: List[Tuple[str, int]]) -> List[Tuple[str, float]]: ...
     def returns(self) -> List[float]: ...
+    def returns_np(self) -> Any: ...
     def equity_curve(self) -> List[int]: ...
     def rebalance_simple(self, targets: List[Tuple[str, float]], prices: List[Tuple[str, int]]) -> None: ...
     def rebalance_lob(self, targets: List[Tuple[str, float]], exchanges: 'MultiExchange') -> None: ...
     def record_return(self, prices: List[Tuple[str, int]]) -> None: ...
+    def record_return_np(self, symbols: List[str], prices: Any) -> None: ...
     def snapshot(self, prices: List[Tuple[str, int]]) -> Dict[str, Any]: ...
+    def rebalance_and_snapshot(self, targets: List[Tuple[str, float]], prices: List[Tuple[str, int]]) -> Dict[str, Any]: ...
     def compute_metrics(self, periods_per_year: float, risk_free: float) -> Optional[Metrics]: ...
     def save_json(self, path: str) -> None: ...
     @staticmethod
     def load_json(path: str) -> 'Portfolio': ...
+    def save_bin(self, path: str) -> None: ...
+    @staticmethod
+    def load_bin(path: str) -> 'Portfolio': ...
 
 class Exchange:
     def __init__(self) -> None: ...
     @staticmethod
     def replay(events: List[Event]) -> 'Exchange': ...
+    @staticmethod
+    def replay_numpy(columns: Dict[str, Any]) -> 'Exchange': ...
+    @staticmethod
+    def replay_pickle_bytes(data: bytes) -> 'Exchange': ...
     def submit_limit(self, side: str, price: int, quantity: int, tif: str = "gtc") -> SubmitResult: ...
     def submit_market(self, side: str, quantity: int) -> SubmitResult: ...
     def cancel(self, order_id: int) -> CancelResult: ...
@@ -185,7 +198,11 @@ class Exchange:
     def last_trade_price(self) -> Optional[int]: ...
     def trades(self) -> List[Trade]: ...
     def events(self) -> List[Event]: ...
+    def events_numpy(self) -> Dict[str, Any]: ...
+    def events_pickle_bytes(self) -> bytes: ...
     def depth(self, levels: int = 10) -> BookSnapshot: ...
+    def imbalance(self, levels: int = 10) -> Optional[float]: ...
+    def weighted_mid(self) -> Optional[float]: ...
     def full_book(self) -> BookSnapshot: ...
     def pending_stop_count(self) -> int: ...
     def clear_trades(self) -> None: ...
@@ -201,14 +218,22 @@ class MultiExchange:
     def submit_market(self, symbol: str, side: str, quantity: int) -> SubmitResult: ...
     def cancel(self, symbol: str, order_id: int) -> CancelResult: ...
     def modify(self, symbol: str, order_id: int, new_price: int, new_quantity: int) -> ModifyResult: ...
+    def submit_limits(self, orders: List[Tuple[str, str, int, int]], tif: str = "gtc") -> List[SubmitResult]: ...
+    def cancel_many(self, orders: List[Tuple[str, int]]) -> List[CancelResult]: ...
+    def modify_many(self, orders: List[Tuple[str, int, int, int]]) -> List[ModifyResult]: ...
+    def apply_events(self, events: List[Tuple[str, Event]]) -> int: ...
     def len(self) -> int: ...
 
 def compute_metrics(returns: List[float], periods_per_year: float = 252.0, risk_free: float = 0.0) -> Optional[Metrics]: ...
+def py_compute_metrics_np(returns: Any, periods_per_year: float = 252.0, risk_free: float = 0.0) -> Optional[Metrics]: ...
 def py_drawdown_series(equity: List[float]) -> List[Dict[str, Any]]: ...
 def py_rolling_max_drawdown(equity: List[float], window: int) -> List[float]: ...
 def sweep_equal_weight(price_series: List[List[Tuple[str, int]]], initial_cash: int, cost_model: CostModel, periods_per_year: float = 252.0, risk_free: float = 0.0) -> BacktestResult: ...
 def run_backtest(strategy: Callable[[int, Dict[str, int], Portfolio], List[Tuple[str, float]]], price_series: List[Dict[str, int]], initial_cash: int, cost_model: CostModel, periods_per_year: float = 252.0, risk_free: float = 0.0) -> BacktestResult: ...
+def jit_strategy(fn: Callable[[int, Dict[str, int]], List[Tuple[str, float]]]) -> Callable[[int, Dict[str, int], Portfolio], List[Tuple[str, float]]]: ...
 def parse_itch(path: str) -> List[Tuple[str, Event]]: ...
+def parse_itch_bytes(data: Union[bytes, bytearray, memoryview]) -> List[Tuple[str, Event]]: ...
+def parse_itch_into(path: str, out: List[Tuple[str, Event]]) -> int: ...
 def py_backtest_weights(weight_schedule: List[List[Tuple[str, float]]], price_schedule: List[List[Tuple[str, int]]], initial_cash: int, cost_bps: int, periods_per_year: float = 252.0, risk_free: float = 0.0, stop_cfg: Optional[Dict[str, Any]] = None) -> Dict[str, Any]: ...
 def py_decompose_backtest(weight_schedule: List[List[Tuple[str, float]]], return_schedule: List[List[Tuple[str, float]]]) -> Dict[str, Any]: ...
 def py_tear_sheet(backtest_result: Dict[str, Any], rolling_window: int = 63, periods_per_year: int = 252) -> Dict[str, Any]: ...
@@ -5,6 +5,7 @@ These aliases provide clean v0.9 names for new callers.
 """
 
 from .nanobook import *  # noqa: F401,F403
+from ._jit import jit_strategy  # noqa: F401
 
 
 def capabilities():
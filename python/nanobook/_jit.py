@@ -0,0 +1,69 @@
+"""Optional Numba compilation for ``run_backtest`` strategies.
+
+Numba is not a dependency. When it is importable, ``jit_strategy``
+compiles the per-bar decision logic with ``numba.njit``; otherwise the
+function runs as plain Python with identical semantics.
+"""
+
+import functools
+import threading
+
+try:
+    from numba import njit, types
+    from numba.typed import Dict
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised when numba is absent
+    HAVE_NUMBA = False
+
+
+def jit_strategy(fn):
+    """Compile ``fn(bar_index, prices)`` into a ``run_backtest`` strategy.
+
+    ``fn`` takes the bar index and a ``{symbol: price_cents}`` mapping and
+    returns a list of ``(symbol, weight)`` tuples. It must stay inside the
+    Numba nopython subset: ints, floats, strings, tuples, lists, and the
+    typed ``prices`` dict — no arbitrary Python objects. The portfolio is
+    a Rust object Numba cannot see, so it is not passed in.
+
+    The returned callable has the usual ``(bar_index, prices, portfolio)``
+    strategy signature. With Numba, ``prices`` is copied into a typed dict
+    that is reused across bars; each thread gets its own, so backtests
+    running the same strategy concurrently (``run_backtest`` releases the
+    GIL between callbacks) do not share it. Without Numba, ``fn`` is
+    called with the plain dict.
+
+    Example::
+
+        @nanobook.jit_strategy
+        def momentum(bar_index, prices):
+            return [(sym, 1.0 / len(prices)) for sym in prices]
+
+        nanobook.run_backtest(momentum, series, 1_000_000_00, cost_model)
+    """
+    if not HAVE_NUMBA:
+
+        @functools.wraps(fn)
+        def strategy(bar_index, prices, portfolio):
+            return fn(bar_index, prices)
+
+        strategy.py_func = fn
+        return strategy
+
+    kernel = njit(cache=True)(fn)
+    local = threading.local()
+
+    @functools.wraps(fn)
+    def strategy(bar_index, prices, portfolio):
+        typed_prices = getattr(local, "prices", None)
+        if typed_prices is None:
+            typed_prices = local.prices = Dict.empty(
+                key_type=types.unicode_type, value_type=types.int64
+            )
+        typed_prices.clear()
+        for symbol, price in prices.items():
+            typed_prices[symbol] = price
+        return kernel(bar_index, typed_prices)
+
+    strategy.py_func = fn
+    return strategy
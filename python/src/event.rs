@@ -1,6 +1,17 @@
 use nanobook::Event;
-use pyo3::IntoPyObjectExt;
 use pyo3::prelude::*;
+use pyo3::pybacked::PyBackedStr;
+use pyo3::sync::PyOnceLock;
+use pyo3::types::PyString;
+use std::cell::RefCell;
+
+/// Interned `Event::KIND_NAMES`, indexed by `Event::kind_code`.
+static KIND_STRINGS: PyOnceLock<[Py<PyString>; Event::KIND_NAMES.len()]> = PyOnceLock::new();
+
+thread_local! {
+    /// Scratch buffer for `__getstate__`, reused across calls on a thread.
+    static STATE_BUF: RefCell<Vec<u8>> = RefCell::new(Vec::with_capacity(256));
+}
 
 #[pyclass(name = "Event")]
 #[derive(Clone)]
@@ -10,32 +21,32 @@ pub struct PyEvent {
 
 #[pymethods]
 impl PyEvent {
+    /// Snake-case event kind. The strings are interned once per process,
+    /// so repeated reads and ``==`` / ``in`` checks do not allocate.
     #[getter]
-    fn kind(&self) -> String {
-        match &self.inner {
-            Event::SubmitLimit { .. } => "submit_limit".to_string(),
-            Event::SubmitMarket { .. } => "submit_market".to_string(),
-            Event::Cancel { .. } => "cancel".to_string(),
-            Event::Modify { .. } => "modify".to_string(),
-            Event::SubmitStopMarket { .. } => "submit_stop_market".to_string(),
-            Event::SubmitStopLimit { .. } => "submit_stop_limit".to_string(),
-            Event::SubmitTrailingStopMarket { .. } => "submit_trailing_stop_market".to_string(),
-            Event::SubmitTrailingStopLimit { .. } => "submit_trailing_stop_limit".to_string(),
-        }
+    fn kind<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        let names = KIND_STRINGS.get_or_init(py, || {
+            Event::KIND_NAMES.map(|name| PyString::intern(py, name).unbind())
+        });
+        names[self.inner.kind_code() as usize].bind(py).clone()
     }
 
     fn __repr__(&self) -> String {
         format!("{:?}", self.inner)
     }
 
-    pub fn __getstate__(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
-        let json = serde_json::to_string(&self.inner)
-            .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
-        json.into_py_any(py)
+    pub fn __getstate__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyString>> {
+        STATE_BUF.with_borrow_mut(|buf| {
+            buf.clear();
+            serde_json::to_writer(&mut *buf, &self.inner)
+                .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
+            let json = std::str::from_utf8(buf).expect("serde_json writes UTF-8");
+            Ok(PyString::new(py, json))
+        })
     }
 
     pub fn __setstate__(&mut self, state: Bound<'_, PyAny>) -> PyResult<()> {
-        let json: String = state.extract()?;
+        let json: PyBackedStr = state.extract()?;
         self.inner = serde_json::from_str(&json)
             .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
         Ok(())
@@ -1,7 +1,10 @@
-use nanobook::{Event, Exchange, OrderId, Price, TrailMethod};
-use pyo3::exceptions::PyValueError;
+use nanobook::persistence::{events_from_slice, write_events};
+use nanobook::{Event, EventColumns, Exchange, OrderId, Price, TrailMethod};
+use numpy::ndarray::Array2;
+use numpy::{Element, IntoPyArray, PyArray2, PyReadonlyArray1};
+use pyo3::exceptions::{PyKeyError, PyOverflowError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyBytes, PyDict};
 
 use crate::event::PyEvent;
 use crate::order::PyOrder;
@@ -49,6 +52,55 @@ impl PyExchange {
         }
     }
 
+    /// Replay events from the column dict produced by ``events_numpy()``.
+    ///
+    /// Every key returned by ``events_numpy()`` is required and the arrays
+    /// must keep their dtypes.
+    ///
+    /// Raises:
+    ///     KeyError: If a column is missing
+    ///     ValueError: If column lengths differ or a row holds an invalid code
+    #[staticmethod]
+    fn replay_numpy(columns: &Bound<'_, PyDict>) -> PyResult<Self> {
+        let columns = EventColumns {
+            kind: column(columns, "kind")?,
+            side: column(columns, "side")?,
+            price: column(columns, "price")?,
+            stop_price: column(columns, "stop_price")?,
+            quantity: column(columns, "quantity")?,
+            order_id: column(columns, "order_id")?,
+            time_in_force: column(columns, "time_in_force")?,
+            trail_type: column(columns, "trail_type")?,
+            trail_offset: column(columns, "trail_offset")?,
+            trail_value: column(columns, "trail_value")?,
+            trail_period: column(columns, "trail_period")?,
+        };
+        columns.validate().map_err(|name| {
+            PyValueError::new_err(format!(
+                "column {name:?} has a different length than \"kind\" ({} rows)",
+                columns.len()
+            ))
+        })?;
+        let events = columns
+            .to_events()
+            .map_err(|row| PyValueError::new_err(format!("invalid event at row {row}")))?;
+        Ok(Self {
+            inner: Exchange::replay(&events),
+        })
+    }
+
+    /// Replay events from bytes produced by ``events_pickle_bytes()``.
+    ///
+    /// Raises:
+    ///     ValueError: If the bytes are not a valid event log
+    #[staticmethod]
+    fn replay_pickle_bytes(data: &[u8]) -> PyResult<Self> {
+        let events = events_from_slice(data).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        Ok(Self {
+            inner: Exchange::replay(&events),
+        })
+    }
+
     // === Order Submission ===
 
     /// Submit a limit order.
@@ -276,6 +328,53 @@ impl PyExchange {
             .collect()
     }
 
+    /// Serialize the whole event log into one ``bytes`` object.
+    ///
+    /// The encoding is JSON Lines, the same format the Rust
+    /// ``Exchange::save`` writes to disk, built in one buffer rather than
+    /// one ``str`` per event. Pickle or ship it, then rebuild with
+    /// ``Exchange.replay_pickle_bytes(data)``.
+    fn events_pickle_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        let mut buf = Vec::new();
+        write_events(self.inner.events(), &mut buf)
+            .map_err(|e| PyValueError::new_err(e.to_string()))?;
+        Ok(PyBytes::new(py, &buf))
+    }
+
+    /// Get recorded events as a dict of numpy arrays, one entry per event.
+    ///
+    /// Columns: ``kind`` (uint8, index into ``EVENT_KINDS``), ``side``
+    /// (uint8, 0=buy 1=sell), ``price`` and ``stop_price`` (int64 cents),
+    /// ``quantity`` and ``order_id`` (uint64), ``time_in_force`` (uint8,
+    /// 0=GTC 1=IOC 2=FOK), ``trail_type`` (uint8, 0=fixed 1=percentage
+    /// 2=sma_abs_change), ``trail_offset`` (int64 cents, fixed trails),
+    /// ``trail_value`` (float64, percentage or multiplier), ``trail_period``
+    /// (uint64). Fields a kind does not carry are 0.
+    ///
+    /// The arrays take ownership of the column buffers without copying.
+    ///
+    /// Example::
+    ///
+    ///     cols = ex.events_numpy()
+    ///     kinds = [nanobook.EVENT_KINDS[k] for k in cols["kind"]]
+    ///
+    fn events_numpy<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let columns = EventColumns::from_events(self.inner.events());
+        let dict = PyDict::new(py);
+        dict.set_item("kind", columns.kind.into_pyarray(py))?;
+        dict.set_item("side", columns.side.into_pyarray(py))?;
+        dict.set_item("price", columns.price.into_pyarray(py))?;
+        dict.set_item("stop_price", columns.stop_price.into_pyarray(py))?;
+        dict.set_item("quantity", columns.quantity.into_pyarray(py))?;
+        dict.set_item("order_id", columns.order_id.into_pyarray(py))?;
+        dict.set_item("time_in_force", columns.time_in_force.into_pyarray(py))?;
+        dict.set_item("trail_type", columns.trail_type.into_pyarray(py))?;
+        dict.set_item("trail_offset", columns.trail_offset.into_pyarray(py))?;
+        dict.set_item("trail_value", columns.trail_value.into_pyarray(py))?;
+        dict.set_item("trail_period", columns.trail_period.into_pyarray(py))?;
+        Ok(dict)
+    }
+
     /// Get a depth snapshot of the book (top N levels each side).
     #[pyo3(signature = (levels=10))]
     fn depth(&self, levels: usize) -> PyBookSnapshot {
@@ -283,6 +382,20 @@ impl PyExchange {
         PyBookSnapshot::from_snapshot(&snap)
     }
 
+    /// Book imbalance over the top ``levels`` of each side.
+    ///
+    /// Same value as ``depth(levels).imbalance()`` but read straight from
+    /// the book, with no snapshot built.
+    #[pyo3(signature = (levels=10))]
+    fn imbalance(&self, levels: usize) -> Option<f64> {
+        self.inner.imbalance(levels)
+    }
+
+    /// Top-of-book volume-weighted midpoint, or None if a side is empty.
+    fn weighted_mid(&self) -> Option<f64> {
+        self.inner.weighted_mid()
+    }
+
     /// Get a full snapshot of the book.
     fn full_book(&self) -> PyBookSnapshot {
         let snap = self.inner.full_book();
@@ -325,25 +438,58 @@ impl PyExchange {
     }
 }
 
+/// Copy one named 1-D array out of an ``events_numpy()`` column dict.
+fn column<T: Element + Clone>(columns: &Bound<'_, PyDict>, name: &str) -> PyResult<Vec<T>> {
+    let array = columns
+        .get_item(name)?
+        .ok_or_else(|| PyKeyError::new_err(name.to_string()))?;
+    let array: PyReadonlyArray1<'_, T> = array.extract()?;
+    Ok(array.as_array().to_vec())
+}
+
 /// Book depth snapshot.
 #[pyclass(name = "BookSnapshot")]
 #[derive(Clone)]
 pub struct PyBookSnapshot {
     inner: nanobook::BookSnapshot,
-    bids: Vec<PyLevelSnapshot>,
-    asks: Vec<PyLevelSnapshot>,
 }
 
 #[pymethods]
 impl PyBookSnapshot {
     #[getter]
     fn bids(&self) -> Vec<PyLevelSnapshot> {
-        self.bids.clone()
+        convert_levels(&self.inner.bids)
     }
 
     #[getter]
     fn asks(&self) -> Vec<PyLevelSnapshot> {
-        self.asks.clone()
+        convert_levels(&self.inner.asks)
+    }
+
+    /// Bid levels as an ``(N, 2)`` int64 array of ``[price, quantity]``
+    /// rows, best first.
+    ///
+    /// One array allocation instead of one ``LevelSnapshot`` per level.
+    ///
+    /// Raises:
+    ///     OverflowError: If a level quantity does not fit in int64
+    ///
+    /// Example::
+    ///
+    ///     depth = ex.depth(20).bids_np()
+    ///     prices, qtys = depth[:, 0], depth[:, 1]
+    ///
+    fn bids_np<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<i64>>> {
+        Ok(levels_array(&self.inner.bids)?.into_pyarray(py))
+    }
+
+    /// Ask levels as an ``(N, 2)`` int64 array of ``[price, quantity]``
+    /// rows, best first.
+    ///
+    /// Raises:
+    ///     OverflowError: If a level quantity does not fit in int64
+    fn asks_np<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<i64>>> {
+        Ok(levels_array(&self.inner.asks)?.into_pyarray(py))
     }
 
     /// Book imbalance: (bid_qty - ask_qty) / (bid_qty + ask_qty).
@@ -369,33 +515,46 @@ impl PyBookSnapshot {
     fn __repr__(&self) -> String {
         format!(
             "BookSnapshot(bids={}, asks={})",
-            self.bids.len(),
-            self.asks.len()
+            self.inner.bids.len(),
+            self.inner.asks.len()
         )
     }
 }
 
 impl PyBookSnapshot {
     pub fn from_snapshot(snap: &nanobook::BookSnapshot) -> Self {
-        fn convert_levels(levels: &[nanobook::LevelSnapshot]) -> Vec<PyLevelSnapshot> {
-            levels
-                .iter()
-                .map(|l| PyLevelSnapshot {
-                    price: l.price.0,
-                    quantity: l.quantity,
-                    order_count: l.order_count,
-                })
-                .collect()
-        }
-
         Self {
             inner: snap.clone(),
-            bids: convert_levels(&snap.bids),
-            asks: convert_levels(&snap.asks),
         }
     }
 }
 
+fn convert_levels(levels: &[nanobook::LevelSnapshot]) -> Vec<PyLevelSnapshot> {
+    levels
+        .iter()
+        .map(|l| PyLevelSnapshot {
+            price: l.price.0,
+            quantity: l.quantity,
+            order_count: l.order_count,
+        })
+        .collect()
+}
+
+/// Pack levels into a row-major ``[price, quantity]`` matrix.
+fn levels_array(levels: &[nanobook::LevelSnapshot]) -> PyResult<Array2<i64>> {
+    let mut flat = Vec::with_capacity(levels.len() * 2);
+    for l in levels {
+        let quantity = i64::try_from(l.quantity).map_err(|_| {
+            PyOverflowError::new_err(format!(
+                "level quantity {} at price {} does not fit in int64",
+                l.quantity, l.price.0
+            ))
+        })?;
+        flat.extend([l.price.0, quantity]);
+    }
+    Ok(Array2::from_shape_vec((levels.len(), 2), flat).expect("two columns per level"))
+}
+
 /// Parse trail method from Python arguments.
 ///
 /// Accepted `trail_type` values:
@@ -1,25 +1,92 @@
 use crate::event::PyEvent;
-use nanobook::itch::{ItchParser, itch_to_event};
+use nanobook::Event;
+use nanobook::itch::{parse_events, parse_file, parse_file_into};
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::PyIOError;
 use pyo3::prelude::*;
-use std::fs::File;
-use std::io::BufReader;
+use pyo3::types::PyList;
+use std::io::{self, ErrorKind};
+use std::path::Path;
 
+/// Malformed ITCH input becomes a plain ``IOError`` with the decoder's
+/// message; OS errors keep pyo3's mapping (``FileNotFoundError``,
+/// ``PermissionError``, ...).
+fn itch_error(e: io::Error) -> PyErr {
+    match e.kind() {
+        ErrorKind::InvalidData | ErrorKind::UnexpectedEof => PyIOError::new_err(e.to_string()),
+        _ => PyErr::from(e),
+    }
+}
+
+fn into_py_events(events: io::Result<Vec<(String, Event)>>) -> PyResult<Vec<(String, PyEvent)>> {
+    let events = events.map_err(itch_error)?;
+    Ok(events
+        .into_iter()
+        .map(|(symbol, event)| (symbol, PyEvent { inner: event }))
+        .collect())
+}
+
+/// Parse an ITCH 5.0 file into (symbol, Event) pairs.
+///
+/// The file is memory-mapped and decoded in place.
 #[pyfunction]
 pub fn parse_itch(path: &str) -> PyResult<Vec<(String, PyEvent)>> {
-    let file = File::open(path)?;
-    let reader = BufReader::new(file);
-    let mut parser = ItchParser::new(reader);
+    into_py_events(parse_file(Path::new(path)))
+}
 
+/// Parse an ITCH 5.0 file and append its (symbol, Event) pairs to ``out``.
+///
+/// Regular files are memory-mapped; pipes and FIFOs (e.g. a
+/// decompressor's output) are streamed through a fixed 64 KiB buffer.
+/// The file is decoded into a temporary buffer first and ``out`` is only
+/// extended once decoding succeeds, so nothing is appended if the file is
+/// malformed.
+///
+/// Args:
+///     path: File to parse.
+///     out: List to extend in place. Reuse one list across files
+///         (``out.clear()`` between replays) instead of concatenating the
+///         fresh lists ``parse_itch`` returns.
+///
+/// Returns:
+///     Number of events appended.
+///
+/// Example::
+///
+///     events = []
+///     for path in paths:
+///         nanobook.parse_itch_into(path, events)
+///
+#[pyfunction]
+pub fn parse_itch_into(path: &str, out: &Bound<'_, PyList>) -> PyResult<usize> {
     let mut events = Vec::new();
-
-    while let Some(msg) = parser
-        .next_message()
-        .map_err(|e| pyo3::exceptions::PyIOError::new_err(e.to_string()))?
-    {
-        if let Some((symbol, event)) = itch_to_event(msg) {
-            events.push((symbol, PyEvent { inner: event }));
-        }
+    parse_file_into(Path::new(path), &mut events).map_err(itch_error)?;
+    let count = events.len();
+    for (symbol, event) in events {
+        out.append((symbol, PyEvent { inner: event }))?;
     }
+    Ok(count)
+}
 
-    Ok(events)
+/// Parse an in-memory ITCH 5.0 stream into (symbol, Event) pairs.
+///
+/// Args:
+///     data: Length-prefixed ITCH frames. ``bytes`` is parsed in place
+///         without copying; any other buffer (``bytearray``,
+///         ``memoryview``, ``mmap``) is copied once.
+///
+/// Example::
+///
+///     events = nanobook.parse_itch_bytes(frame)
+///
+#[pyfunction]
+pub fn parse_itch_bytes(
+    py: Python<'_>,
+    data: &Bound<'_, PyAny>,
+) -> PyResult<Vec<(String, PyEvent)>> {
+    if let Ok(bytes) = data.extract::<&[u8]>() {
+        return into_py_events(parse_events(bytes));
+    }
+    let buffer = PyBuffer::<u8>::get(data)?;
+    into_py_events(parse_events(&buffer.to_vec(py)?))
 }
@@ -61,6 +61,7 @@ fn nanobook(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<multi::PyMultiExchange>()?;
     m.add_class::<order::PyOrder>()?;
     m.add_class::<event::PyEvent>()?;
+    m.add("EVENT_KINDS", nanobook::Event::KIND_NAMES.to_vec())?;
 
     // Result types
     m.add_class::<results::PySubmitResult>()?;
@@ -80,6 +81,7 @@ fn nanobook(m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     // v0.7 functions
     m.add_function(wrap_pyfunction!(metrics::py_compute_metrics, m)?)?;
+    m.add_function(wrap_pyfunction!(metrics::py_compute_metrics_np, m)?)?;
     m.add_function(wrap_pyfunction!(metrics::py_drawdown_series, m)?)?;
     m.add_function(wrap_pyfunction!(metrics::py_rolling_max_drawdown, m)?)?;
     m.add_function(wrap_pyfunction!(sweep::py_sweep_equal_weight, m)?)?;
@@ -90,6 +92,10 @@ fn nanobook(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(backtest_bridge::py_tear_sheet, m)?)?;
     #[cfg(feature = "itch")]
     m.add_function(wrap_pyfunction!(itch::parse_itch, m)?)?;
+    #[cfg(feature = "itch")]
+    m.add_function(wrap_pyfunction!(itch::parse_itch_bytes, m)?)?;
+    #[cfg(feature = "itch")]
+    m.add_function(wrap_pyfunction!(itch::parse_itch_into, m)?)?;
 
     // v0.8 — Technical indicators (ta-lib replacements)
     m.add_function(wrap_pyfunction!(indicators::py_sma, m)?)?;
@@ -2,6 +2,7 @@ use nanobook::portfolio::metrics::{
     Metrics, compute_metrics, drawdown_series, rolling_max_drawdown, rolling_sharpe,
     rolling_volatility,
 };
+use numpy::{PyReadonlyArray1, PyUntypedArrayMethods};
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
 
@@ -103,6 +104,31 @@ pub fn py_compute_metrics(
     compute_metrics(&returns, periods_per_year, risk_free).map(PyMetrics::from)
 }
 
+/// Compute performance metrics from a float64 numpy array of returns.
+///
+/// Same result as ``py_compute_metrics`` but reads the array buffer in
+/// place instead of converting a list element by element. Non-contiguous
+/// arrays are copied once.
+///
+/// Example::
+///
+///     m = nanobook.py_compute_metrics_np(np.array([0.01, -0.005, 0.02]))
+///
+#[pyfunction]
+#[pyo3(signature = (returns, periods_per_year=252.0, risk_free=0.0))]
+pub fn py_compute_metrics_np(
+    returns: PyReadonlyArray1<'_, f64>,
+    periods_per_year: f64,
+    risk_free: f64,
+) -> Option<PyMetrics> {
+    let metrics = if returns.is_contiguous() {
+        compute_metrics(returns.as_slice().ok()?, periods_per_year, risk_free)
+    } else {
+        compute_metrics(&returns.as_array().to_vec(), periods_per_year, risk_free)
+    };
+    metrics.map(PyMetrics::from)
+}
+
 /// Detect drawdown events from an equity curve.
 #[pyfunction]
 pub fn py_drawdown_series(py: Python<'_>, equity: Vec<f64>) -> PyResult<Py<PyAny>> {
@@ -1,6 +1,9 @@
-use nanobook::{MultiExchange, OrderId, Price};
+use nanobook::{Event, Exchange, MultiExchange, OrderId, Price, Symbol};
 use pyo3::prelude::*;
+use pyo3::types::PyString;
+use std::collections::HashMap;
 
+use crate::event::PyEvent;
 use crate::exchange::PyExchange;
 use crate::results::*;
 use crate::types::{parse_side, parse_symbol, parse_tif};
@@ -15,6 +18,30 @@ use crate::types::{parse_side, parse_symbol, parse_tif};
 #[pyclass(name = "MultiExchange")]
 pub struct PyMultiExchange {
     pub inner: MultiExchange,
+    /// Python string for each symbol, created the first time
+    /// ``symbols()`` / ``best_prices()`` report it so later calls hand back
+    /// the same objects. Order forwarding never touches this map.
+    names: HashMap<Symbol, Py<PyString>>,
+}
+
+impl PyMultiExchange {
+    /// Route to the exchange for `symbol`, creating it on first use.
+    fn exchange(&mut self, symbol: &str) -> PyResult<&mut Exchange> {
+        let sym = parse_symbol(symbol)?;
+        Ok(self.inner.get_or_create(&sym))
+    }
+}
+
+/// Cached Python name for `sym`, created on first request.
+fn cached_name(
+    names: &mut HashMap<Symbol, Py<PyString>>,
+    py: Python<'_>,
+    sym: &Symbol,
+) -> Py<PyString> {
+    names
+        .entry(*sym)
+        .or_insert_with(|| PyString::new(py, sym.as_str()).unbind())
+        .clone_ref(py)
 }
 
 #[pymethods]
@@ -23,6 +50,7 @@ impl PyMultiExchange {
     fn new() -> Self {
         Self {
             inner: MultiExchange::new(),
+            names: HashMap::new(),
         }
     }
 
@@ -32,31 +60,32 @@ impl PyMultiExchange {
     /// to the returned ``PyExchange`` do NOT flow back to the ``MultiExchange``.
     /// For mutations, use the ``submit_*`` methods directly on ``MultiExchange``.
     fn get_or_create(&mut self, symbol: &str) -> PyResult<PyExchange> {
-        let sym = parse_symbol(symbol)?;
-        let ex = self.inner.get_or_create(&sym);
+        let ex = self.exchange(symbol)?;
         Ok(PyExchange::from_exchange(ex.clone()))
     }
 
     /// List all symbols that have exchanges.
-    fn symbols(&self) -> Vec<String> {
+    fn symbols(&mut self, py: Python<'_>) -> Vec<Py<PyString>> {
+        let names = &mut self.names;
         self.inner
             .symbols()
-            .map(|s| s.as_str().to_string())
+            .map(|s| cached_name(names, py, s))
             .collect()
     }
 
     /// Get best bid/ask prices for all symbols.
     /// Returns list of (symbol, bid, ask) tuples.
-    fn best_prices(&self) -> Vec<(String, Option<i64>, Option<i64>)> {
+    fn best_prices(&mut self, py: Python<'_>) -> Vec<(Py<PyString>, Option<i64>, Option<i64>)> {
+        let names = &mut self.names;
         self.inner
-            .symbols()
-            .map(|sym| {
-                let (bid, ask) = self
-                    .inner
-                    .get(sym)
-                    .map(|ex| ex.best_bid_ask())
-                    .unwrap_or((None, None));
-                (sym.to_string(), bid.map(|p| p.0), ask.map(|p| p.0))
+            .best_prices()
+            .into_iter()
+            .map(|(sym, bid, ask)| {
+                (
+                    cached_name(names, py, &sym),
+                    bid.map(|p| p.0),
+                    ask.map(|p| p.0),
+                )
             })
             .collect()
     }
@@ -72,10 +101,9 @@ impl PyMultiExchange {
         quantity: u64,
         tif: &str,
     ) -> PyResult<PySubmitResult> {
-        let sym = parse_symbol(symbol)?;
         let side = parse_side(side)?;
         let tif = parse_tif(tif)?;
-        let ex = self.inner.get_or_create(&sym);
+        let ex = self.exchange(symbol)?;
         Ok(ex.submit_limit(side, Price(price), quantity, tif).into())
     }
 
@@ -85,15 +113,13 @@ impl PyMultiExchange {
         side: &str,
         quantity: u64,
     ) -> PyResult<PySubmitResult> {
-        let sym = parse_symbol(symbol)?;
         let side = parse_side(side)?;
-        let ex = self.inner.get_or_create(&sym);
+        let ex = self.exchange(symbol)?;
         Ok(ex.submit_market(side, quantity).into())
     }
 
     fn cancel(&mut self, symbol: &str, order_id: u64) -> PyResult<PyCancelResult> {
-        let sym = parse_symbol(symbol)?;
-        let ex = self.inner.get_or_create(&sym);
+        let ex = self.exchange(symbol)?;
         Ok(ex.cancel(OrderId(order_id)).into())
     }
 
@@ -104,13 +130,133 @@ impl PyMultiExchange {
         new_price: i64,
         new_quantity: u64,
     ) -> PyResult<PyModifyResult> {
-        let sym = parse_symbol(symbol)?;
-        let ex = self.inner.get_or_create(&sym);
+        let ex = self.exchange(symbol)?;
         Ok(ex
             .modify(OrderId(order_id), Price(new_price), new_quantity)
             .into())
     }
 
+    // === Batch Forwarding ===
+    //
+    // Each batch crosses into Rust once. Every row is parsed before any
+    // order is routed, so a bad row raises without applying earlier ones,
+    // and the routing loop runs with the GIL released.
+
+    /// Submit many limit orders in one call.
+    ///
+    /// Args:
+    ///     orders: List of ``(symbol, side, price, quantity)`` tuples.
+    ///     tif: Time-in-force applied to every order.
+    ///
+    /// Returns:
+    ///     One SubmitResult per order, in input order.
+    ///
+    /// Example::
+    ///
+    ///     results = multi.submit_limits([("AAPL", "buy", 15000, 100),
+    ///                                    ("MSFT", "sell", 30000, 50)])
+    ///
+    #[pyo3(signature = (orders, tif="gtc"))]
+    fn submit_limits(
+        &mut self,
+        py: Python<'_>,
+        orders: Vec<(String, String, i64, u64)>,
+        tif: &str,
+    ) -> PyResult<Vec<PySubmitResult>> {
+        let tif = parse_tif(tif)?;
+        let rows = orders
+            .iter()
+            .map(|(symbol, side, price, qty)| {
+                Ok((parse_symbol(symbol)?, parse_side(side)?, *price, *qty))
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+        let inner = &mut self.inner;
+        let results = py.detach(|| {
+            rows.into_iter()
+                .map(|(sym, side, price, qty)| {
+                    inner
+                        .get_or_create(&sym)
+                        .submit_limit(side, Price(price), qty, tif)
+                })
+                .collect::<Vec<_>>()
+        });
+        Ok(results.into_iter().map(Into::into).collect())
+    }
+
+    /// Cancel many orders in one call.
+    ///
+    /// Args:
+    ///     orders: List of ``(symbol, order_id)`` tuples.
+    ///
+    /// Returns:
+    ///     One CancelResult per order, in input order.
+    fn cancel_many(
+        &mut self,
+        py: Python<'_>,
+        orders: Vec<(String, u64)>,
+    ) -> PyResult<Vec<PyCancelResult>> {
+        let rows = orders
+            .iter()
+            .map(|(symbol, id)| Ok((parse_symbol(symbol)?, OrderId(*id))))
+            .collect::<PyResult<Vec<_>>>()?;
+        let inner = &mut self.inner;
+        let results = py.detach(|| {
+            rows.into_iter()
+                .map(|(sym, id)| inner.get_or_create(&sym).cancel(id))
+                .collect::<Vec<_>>()
+        });
+        Ok(results.into_iter().map(Into::into).collect())
+    }
+
+    /// Modify many orders in one call.
+    ///
+    /// Args:
+    ///     orders: List of ``(symbol, order_id, new_price, new_quantity)``
+    ///         tuples.
+    ///
+    /// Returns:
+    ///     One ModifyResult per order, in input order.
+    fn modify_many(
+        &mut self,
+        py: Python<'_>,
+        orders: Vec<(String, u64, i64, u64)>,
+    ) -> PyResult<Vec<PyModifyResult>> {
+        let rows = orders
+            .iter()
+            .map(|(symbol, id, price, qty)| {
+                Ok((parse_symbol(symbol)?, OrderId(*id), Price(*price), *qty))
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+        let inner = &mut self.inner;
+        let results = py.detach(|| {
+            rows.into_iter()
+                .map(|(sym, id, price, qty)| inner.get_or_create(&sym).modify(id, price, qty))
+                .collect::<Vec<_>>()
+        });
+        Ok(results.into_iter().map(Into::into).collect())
+    }
+
+    /// Apply ``(symbol, Event)`` pairs, routing each event to its symbol's
+    /// book and recording it in that book's event log.
+    ///
+    /// Accepts the output of ``parse_itch`` directly, provided every
+    /// pair carries a symbol.
+    ///
+    /// Returns:
+    ///     Total number of trades produced.
+    fn apply_events(&mut self, py: Python<'_>, events: Vec<(String, PyEvent)>) -> PyResult<usize> {
+        let rows = events
+            .into_iter()
+            .map(|(symbol, event)| Ok((parse_symbol(&symbol)?, event.inner)))
+            .collect::<PyResult<Vec<(Symbol, Event)>>>()?;
+        let inner = &mut self.inner;
+        Ok(py.detach(|| {
+            rows.iter()
+                .map(|(sym, event)| inner.get_or_create(sym).apply(event).trades.len())
+                .sum::<usize>()
+        }))
+    }
+
     /// Number of symbols.
     fn len(&self) -> usize {
         self.inner.len()
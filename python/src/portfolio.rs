@@ -1,4 +1,6 @@
-use nanobook::portfolio::{CostModel, Portfolio};
+use nanobook::portfolio::{CostModel, Portfolio, PortfolioSnapshot};
+use numpy::{IntoPyArray, PyArray1, PyReadonlyArray1};
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
 
@@ -65,6 +67,8 @@ impl PyCostModel {
 /// Args:
 ///     initial_cash: Starting cash in cents (e.g., 1_000_000_00 = $1M)
 ///     cost_model: A CostModel instance
+///     capacity: Expected number of ``record_return`` calls; the return
+///         series and equity curve are preallocated for that many periods
 ///
 /// Example::
 ///
@@ -86,9 +90,10 @@ impl PyPortfolio {
 #[pymethods]
 impl PyPortfolio {
     #[new]
-    fn new(initial_cash: i64, cost_model: &PyCostModel) -> Self {
+    #[pyo3(signature = (initial_cash, cost_model, capacity=0))]
+    fn new(initial_cash: i64, cost_model: &PyCostModel, capacity: usize) -> Self {
         Self {
-            inner: Portfolio::new(initial_cash, cost_model.inner),
+            inner: Portfolio::with_capacity(initial_cash, cost_model.inner, capacity),
         }
     }
 
@@ -143,6 +148,11 @@ impl PyPortfolio {
         self.inner.returns().to_vec()
     }
 
+    /// Get the return series as a float64 numpy array.
+    fn returns_np<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f64>> {
+        self.inner.returns().to_vec().into_pyarray(py)
+    }
+
     /// Get the equity curve.
     fn equity_curve(&self) -> Vec<i64> {
         self.inner.equity_curve().to_vec()
@@ -182,24 +192,65 @@ impl PyPortfolio {
         Ok(())
     }
 
+    /// Record a return from parallel symbol and price arrays.
+    ///
+    /// Same as ``record_return(list(zip(symbols, prices)))`` without
+    /// building the tuples.
+    ///
+    /// Args:
+    ///     symbols: Symbols, one per price.
+    ///     prices: int64 numpy array of prices in cents.
+    ///
+    /// Example::
+    ///
+    ///     for row in price_matrix:
+    ///         portfolio.record_return_np(universe, row)
+    ///
+    fn record_return_np(
+        &mut self,
+        symbols: Vec<String>,
+        prices: PyReadonlyArray1<'_, i64>,
+    ) -> PyResult<()> {
+        let prices = prices.as_array();
+        if symbols.len() != prices.len() {
+            return Err(PyValueError::new_err(format!(
+                "symbols has {} entries but prices has {}",
+                symbols.len(),
+                prices.len()
+            )));
+        }
+        let prices = symbols
+            .iter()
+            .zip(prices.iter())
+            .map(|(s, &p)| Ok((parse_symbol(s)?, p)))
+            .collect::<PyResult<Vec<_>>>()?;
+        self.inner.record_return(&prices);
+        Ok(())
+    }
+
     /// Take a portfolio snapshot.
     fn snapshot(&self, py: Python<'_>, prices: Vec<(String, i64)>) -> PyResult<Py<PyAny>> {
         let prices = parse_price_list(&prices)?;
-        let snap = self.inner.snapshot(&prices);
-
-        let dict = PyDict::new(py);
-        dict.set_item("cash", snap.cash)?;
-        dict.set_item("equity", snap.equity)?;
-        dict.set_item("num_positions", snap.num_positions)?;
-        dict.set_item("total_realized_pnl", snap.total_realized_pnl)?;
-
-        let weights = PyDict::new(py);
-        for (sym, w) in snap.weights {
-            weights.set_item(sym.to_string(), w)?;
-        }
-        dict.set_item("weights", weights)?;
+        snapshot_dict(py, self.inner.snapshot(&prices))
+    }
 
-        Ok(dict.into_any().unbind())
+    /// Rebalance with simple fill and return the resulting snapshot.
+    ///
+    /// Same result as ``rebalance_simple(targets, prices)`` followed by
+    /// ``snapshot(prices)``, but the prices are parsed and hashed once.
+    ///
+    /// Args:
+    ///     targets: List of (symbol, weight) tuples. Weights should sum to <= 1.0.
+    ///     prices: List of (symbol, price_in_cents) tuples.
+    fn rebalance_and_snapshot(
+        &mut self,
+        py: Python<'_>,
+        targets: Vec<(String, f64)>,
+        prices: Vec<(String, i64)>,
+    ) -> PyResult<Py<PyAny>> {
+        let targets = parse_target_list(&targets)?;
+        let prices = parse_price_list(&prices)?;
+        snapshot_dict(py, self.inner.rebalance_and_snapshot(&targets, &prices))
     }
 
     /// Compute metrics from the recorded return series.
@@ -227,6 +278,24 @@ impl PyPortfolio {
         Ok(Self { inner })
     }
 
+    /// Save portfolio state to a compact binary file.
+    ///
+    /// Faster than ``save_json`` for long return/equity series; the file is
+    /// not human-readable. Load it back with ``Portfolio.load_bin``.
+    fn save_bin(&self, path: &str) -> PyResult<()> {
+        self.inner
+            .save_bin(std::path::Path::new(path))
+            .map_err(|e| pyo3::exceptions::PyIOError::new_err(e.to_string()))
+    }
+
+    /// Load portfolio state from a file written by ``save_bin``.
+    #[staticmethod]
+    fn load_bin(path: &str) -> PyResult<Self> {
+        let inner = Portfolio::load_bin(std::path::Path::new(path))
+            .map_err(|e| pyo3::exceptions::PyIOError::new_err(e.to_string()))?;
+        Ok(Self { inner })
+    }
+
     fn __repr__(&self) -> String {
         format!(
             "Portfolio(cash=${:.2}, returns={})",
@@ -251,3 +320,20 @@ fn parse_target_list(targets: &[(String, f64)]) -> PyResult<Vec<(nanobook::Symbo
         .map(|(s, w)| Ok((parse_symbol(s)?, *w)))
         .collect()
 }
+
+/// Convert a snapshot into the dict returned by `snapshot()`.
+fn snapshot_dict(py: Python<'_>, snap: PortfolioSnapshot) -> PyResult<Py<PyAny>> {
+    let dict = PyDict::new(py);
+    dict.set_item("cash", snap.cash)?;
+    dict.set_item("equity", snap.equity)?;
+    dict.set_item("num_positions", snap.num_positions)?;
+    dict.set_item("total_realized_pnl", snap.total_realized_pnl)?;
+
+    let weights = PyDict::new(py);
+    for (sym, w) in snap.weights {
+        weights.set_item(sym.to_string(), w)?;
+    }
+    dict.set_item("weights", weights)?;
+
+    Ok(dict.into_any().unbind())
+}
@@ -1,6 +1,7 @@
 use nanobook::Symbol;
 use nanobook::portfolio::{Portfolio, Strategy, run_backtest};
 use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyString};
 use std::collections::HashMap;
 
 use crate::portfolio::{PyCostModel, PyPortfolio};
@@ -9,6 +10,41 @@ use crate::types::parse_symbol;
 
 pub struct PyStrategy {
     pub callback: Py<PyAny>,
+    /// Prices dict handed to the callback, cleared and refilled each bar.
+    prices: Py<PyDict>,
+    /// Python key for every symbol in the series, converted once.
+    keys: HashMap<Symbol, Py<PyString>>,
+}
+
+impl PyStrategy {
+    fn new(py: Python<'_>, callback: Py<PyAny>, series: &[Vec<(Symbol, i64)>]) -> Self {
+        let mut keys = HashMap::new();
+        for &(sym, _) in series.iter().flatten() {
+            keys.entry(sym)
+                .or_insert_with(|| PyString::new(py, sym.as_str()).unbind());
+        }
+        Self {
+            callback,
+            prices: PyDict::new(py).unbind(),
+            keys,
+        }
+    }
+
+    fn fill_prices<'py>(
+        &self,
+        py: Python<'py>,
+        prices: &[(Symbol, i64)],
+    ) -> PyResult<Bound<'py, PyDict>> {
+        let dict = self.prices.bind(py);
+        dict.clear();
+        for (sym, p) in prices {
+            match self.keys.get(sym) {
+                Some(key) => dict.set_item(key.bind(py), *p)?,
+                None => dict.set_item(sym.as_str(), *p)?,
+            }
+        }
+        Ok(dict.clone())
+    }
 }
 
 impl Strategy for PyStrategy {
@@ -19,15 +55,12 @@ impl Strategy for PyStrategy {
         portfolio: &Portfolio,
     ) -> Vec<(Symbol, f64)> {
         Python::attach(|py| {
-            let py_prices: HashMap<String, i64> = prices
-                .iter()
-                .map(|(sym, p)| (sym.to_string(), *p))
-                .collect();
-
             let py_portfolio = PyPortfolio::from_portfolio(portfolio.clone());
 
-            let args = (bar_index, py_prices, py_portfolio);
-            let result = self.callback.call1(py, args);
+            let result = self.fill_prices(py, prices).and_then(|py_prices| {
+                self.callback
+                    .call1(py, (bar_index, py_prices, py_portfolio))
+            });
 
             match result {
                 Ok(obj) => {
@@ -47,10 +80,16 @@ impl Strategy for PyStrategy {
     }
 }
 
+/// Run a backtest, calling ``strategy(bar_index, prices, portfolio)`` per bar.
+///
+/// The rebalance/record loop runs in Rust with the GIL released; it is only
+/// re-acquired for the callback. ``prices`` is one dict reused across bars
+/// (cleared and refilled), so copy it if the strategy keeps it past the call.
 #[pyfunction]
 #[pyo3(name = "run_backtest")]
 #[pyo3(signature = (strategy, price_series, initial_cash, cost_model, periods_per_year=252.0, risk_free=0.0))]
 pub fn py_run_backtest(
+    py: Python<'_>,
     strategy: Py<PyAny>,
     price_series: Vec<HashMap<String, i64>>,
     initial_cash: i64,
@@ -58,8 +97,6 @@ pub fn py_run_backtest(
     periods_per_year: f64,
     risk_free: f64,
 ) -> PyResult<PyBacktestResult> {
-    let strat = PyStrategy { callback: strategy };
-
     let mut rust_series = Vec::with_capacity(price_series.len());
     for bar in price_series {
         let mut rust_bar = Vec::with_capacity(bar.len());
@@ -69,14 +106,18 @@ pub fn py_run_backtest(
         rust_series.push(rust_bar);
     }
 
-    let result = run_backtest(
-        &strat,
-        &rust_series,
-        initial_cash,
-        cost_model.inner,
-        periods_per_year,
-        risk_free,
-    );
+    let strat = PyStrategy::new(py, strategy, &rust_series);
+
+    let result = py.detach(|| {
+        run_backtest(
+            &strat,
+            &rust_series,
+            initial_cash,
+            cost_model.inner,
+            periods_per_year,
+            risk_free,
+        )
+    });
 
     Ok(result.into())
 }
@@ -4,6 +4,15 @@ import struct
 import tempfile
 import os
 
+# Precompiled packers: skip struct.pack's format-cache lookup and
+# bound-method dispatch on every frame built below.
+_U16 = struct.Struct(">H")
+_U32 = struct.Struct(">I")
+_U64 = struct.Struct(">Q")
+_REPLACE = struct.Struct(">HH6sQQII")
+_EXECUTED = struct.Struct(">HH6sQIQ")
+_DELETE = struct.Struct(">HH6sQ")
+
 def test_parse_itch_add_order():
     # ITCH 5.0 Add Order (A) message
     # Length: 36 bytes
@@ -18,35 +27,28 @@ def test_parse_itch_add_order():
     # Price: 1000000 (u32) ($100.0000)
     
     msg_type = b'A'
-    locate = struct.pack(">H", 1)
-    tracking = struct.pack(">H", 0)
+    locate = _U16.pack(1)
+    tracking = _U16.pack(0)
     ts = b'\x00\x00\x00\x00\x30\x39' # 12345 in 6 bytes
-    ref = struct.pack(">Q", 1)
+    ref = _U64.pack(1)
     side = b'B'
-    shares = struct.pack(">I", 100)
+    shares = _U32.pack(100)
     stock = b'AAPL    '
-    price = struct.pack(">I", 1000000)
+    price = _U32.pack(1000000)
     
     payload = msg_type + locate + tracking + ts + ref + side + shares + stock + price
-    length = struct.pack(">H", len(payload))
+    length = _U16.pack(len(payload))
     full_msg = length + payload
-    
-    with tempfile.NamedTemporaryFile(delete=False) as f:
-        f.write(full_msg)
-        path = f.name
-        
-    try:
-        events = nanobook.parse_itch(path)
-        assert len(events) == 1
-        symbol, event = events[0]
-        assert symbol == "AAPL"
-        assert event.kind == "submit_limit"
-        # Nanobook price is cents. ITCH price 1,000,000 / 100 = 10,000 cents ($100.00)
-        # Wait, my itch_to_event did: nb_price = (price / 100) as i64;
-        # 1,000,000 / 100 = 10,000. Correct.
-        assert "price: Price(10000)" in repr(event)
-    finally:
-        os.unlink(path)
+
+    events = nanobook.parse_itch_bytes(full_msg)
+    assert len(events) == 1
+    symbol, event = events[0]
+    assert symbol == "AAPL"
+    assert event.kind == "submit_limit"
+    # Nanobook price is cents. ITCH price 1,000,000 / 100 = 10,000 cents ($100.00)
+    # Wait, my itch_to_event did: nb_price = (price / 100) as i64;
+    # 1,000,000 / 100 = 10,000. Correct.
+    assert "price: Price(10000)" in repr(event)
 
 def test_parse_itch_replace_order():
     # ITCH 5.0 Replace Order (U) message
@@ -58,93 +60,114 @@ def test_parse_itch_replace_order():
     # Shares: 50 (u32)
     # Price: 1010000 (u32)
     
-    payload = b'U' + struct.pack(">HH6sQQII", 1, 0, b'\x00'*6, 1, 2, 50, 1010000)
-    length = struct.pack(">H", len(payload))
-    
-    with tempfile.NamedTemporaryFile(delete=False) as f:
-        f.write(length + payload)
-        path = f.name
-        
-    try:
-        events = nanobook.parse_itch(path)
-        assert len(events) == 1
-        symbol, event = events[0]
-        assert event.kind == "modify"
-        assert "order_id: OrderId(1)" in repr(event)
-        assert "new_price: Price(10100)" in repr(event)
-        assert "new_quantity: 50" in repr(event)
-    finally:
-        os.unlink(path)
+    payload = b'U' + _REPLACE.pack(1, 0, b'\x00'*6, 1, 2, 50, 1010000)
+    length = _U16.pack(len(payload))
+
+    events = nanobook.parse_itch_bytes(length + payload)
+    assert len(events) == 1
+    symbol, event = events[0]
+    assert event.kind == "modify"
+    assert "order_id: OrderId(1)" in repr(event)
+    assert "new_price: Price(10100)" in repr(event)
+    assert "new_quantity: 50" in repr(event)
 
 def test_parse_itch_executed():
     # ITCH 5.0 Order Executed (E)
     # Ref: 1 (u64), Shares: 100 (u32), Match: 42 (u64)
-    payload = b'E' + struct.pack(">HH6sQIQ", 1, 0, b'\x00'*6, 1, 100, 42)
-    length = struct.pack(">H", len(payload))
-    
-    with tempfile.NamedTemporaryFile(delete=False) as f:
-        f.write(length + payload)
-        path = f.name
-    try:
-        events = nanobook.parse_itch(path)
-        assert len(events) == 0 # internal match handles it
-    finally:
-        os.unlink(path)
+    payload = b'E' + _EXECUTED.pack(1, 0, b'\x00'*6, 1, 100, 42)
+    length = _U16.pack(len(payload))
+
+    events = nanobook.parse_itch_bytes(length + payload)
+    assert len(events) == 0 # internal match handles it
 
 def test_parse_itch_delete():
     # ITCH 5.0 Order Delete (D)
-    payload = b'D' + struct.pack(">HH6sQ", 1, 0, b'\x00'*6, 1)
-    length = struct.pack(">H", len(payload))
-    
-    with tempfile.NamedTemporaryFile(delete=False) as f:
-        f.write(length + payload)
-        path = f.name
-    try:
-        events = nanobook.parse_itch(path)
-        assert len(events) == 1
-        assert events[0][1].kind == "cancel"
-    finally:
-        os.unlink(path)
+    payload = b'D' + _DELETE.pack(1, 0, b'\x00'*6, 1)
+    length = _U16.pack(len(payload))
+
+    events = nanobook.parse_itch_bytes(length + payload)
+    assert len(events) == 1
+    assert events[0][1].kind == "cancel"
 
 def test_parse_itch_trade():
     # ITCH 5.0 Trade (P)
     payload = bytearray(b'P' + b'\x00'*43)
     payload[19] = ord('B') # Side
-    struct.pack_into(">I", payload, 20, 100) # Shares
+    _U32.pack_into(payload, 20, 100) # Shares
     payload[24:32] = b'AAPL    '
-    struct.pack_into(">I", payload, 32, 1000000) # Price
+    _U32.pack_into(payload, 32, 1000000) # Price
     
-    length = struct.pack(">H", len(payload))
+    length = _U16.pack(len(payload))
+    events = nanobook.parse_itch_bytes(length + payload)
+    assert len(events) == 0 # P msg is off-book
+
+def test_parse_itch_truncated_message():
+    # Malformed: type 'A' (AddOrder) needs 36 bytes but we only provide 5
+    payload = b'A' + b'\x00' * 4
+    length = _U16.pack(len(payload))
+
+    with pytest.raises(OSError, match="too short"):
+        nanobook.parse_itch_bytes(length + payload)
+
+def test_parse_itch_zero_length():
+    # Malformed: length prefix is 0
+    with pytest.raises(OSError, match="length is 0"):
+        nanobook.parse_itch_bytes(_U16.pack(0))
+
+def test_parse_itch_bytes_accepts_buffers():
+    # Delete (D) frame fed as bytearray and memoryview
+    payload = b'D' + _DELETE.pack(1, 0, b'\x00'*6, 1)
+    frame = _U16.pack(len(payload)) + payload
+    for buf in (bytearray(frame), memoryview(frame)):
+        events = nanobook.parse_itch_bytes(buf)
+        assert len(events) == 1
+        assert events[0][1].kind == "cancel"
+
+def test_parse_itch_file():
+    # File path goes through the memory-mapped parser
+    payload = b'D' + _DELETE.pack(1, 0, b'\x00'*6, 1)
     with tempfile.NamedTemporaryFile(delete=False) as f:
-        f.write(length + payload)
+        f.write(_U16.pack(len(payload)) + payload)
         path = f.name
     try:
         events = nanobook.parse_itch(path)
-        assert len(events) == 0 # P msg is off-book
+        assert len(events) == 1
+        assert events[0][1].kind == "cancel"
     finally:
         os.unlink(path)
 
-def test_parse_itch_truncated_message():
-    # Malformed: type 'A' (AddOrder) needs 36 bytes but we only provide 5
-    payload = b'A' + b'\x00' * 4
-    length = struct.pack(">H", len(payload))
-
+def test_parse_itch_into_appends():
+    payload = b'D' + _DELETE.pack(1, 0, b'\x00'*6, 1)
+    frame = _U16.pack(len(payload)) + payload
     with tempfile.NamedTemporaryFile(delete=False) as f:
-        f.write(length + payload)
+        f.write(frame * 3)
         path = f.name
     try:
-        with pytest.raises(OSError, match="too short"):
-            nanobook.parse_itch(path)
+        events = [("sentinel", None)]
+        assert nanobook.parse_itch_into(path, events) == 3
+        assert len(events) == 4
+        assert events[0] == ("sentinel", None)
+        assert all(e.kind == "cancel" for _, e in events[1:])
     finally:
         os.unlink(path)
 
-def test_parse_itch_zero_length():
-    # Malformed: length prefix is 0
+def test_parse_itch_into_leaves_list_untouched_on_error():
+    payload = b'D' + _DELETE.pack(1, 0, b'\x00'*6, 1)
+    frame = _U16.pack(len(payload)) + payload
     with tempfile.NamedTemporaryFile(delete=False) as f:
-        f.write(struct.pack(">H", 0))
+        f.write(frame + _U16.pack(0))
         path = f.name
     try:
+        events = []
         with pytest.raises(OSError, match="length is 0"):
-            nanobook.parse_itch(path)
+            nanobook.parse_itch_into(path, events)
+        assert events == []
     finally:
         os.unlink(path)
+
+def test_parse_itch_missing_file_raises_file_not_found():
+    missing = os.path.join(tempfile.gettempdir(), "nanobook-missing.itch")
+    with pytest.raises(FileNotFoundError):
+        nanobook.parse_itch(missing)
+    with pytest.raises(FileNotFoundError):
+        nanobook.parse_itch_into(missing, [])
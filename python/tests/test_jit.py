@@ -0,0 +1,53 @@
+"""Tests for the optional Numba strategy decorator."""
+
+import nanobook
+import pytest
+from nanobook import _jit
+
+
+def _equal_weight(bar_index, prices):
+    n = len(prices)
+    return [(sym, 1.0 / n) for sym in prices]
+
+
+PRICE_SERIES = [
+    {"AAPL": 100_00, "MSFT": 200_00},
+    {"AAPL": 110_00, "MSFT": 190_00},
+    {"AAPL": 120_00, "MSFT": 210_00},
+]
+
+
+def _run(strategy):
+    return nanobook.run_backtest(strategy, PRICE_SERIES, 100_000_00, nanobook.CostModel.zero())
+
+
+def test_jit_strategy_without_numba_matches_plain_python(monkeypatch):
+    monkeypatch.setattr(_jit, "HAVE_NUMBA", False)
+    wrapped = _jit.jit_strategy(_equal_weight)
+    assert wrapped.py_func is _equal_weight
+    assert wrapped.__name__ == "_equal_weight"
+
+    expected = _run(lambda i, prices, portfolio: _equal_weight(i, prices))
+    res = _run(wrapped)
+    assert res.portfolio.returns() == expected.portfolio.returns()
+
+
+def test_jit_strategy_with_numba():
+    pytest.importorskip("numba")
+    wrapped = nanobook.jit_strategy(_equal_weight)
+
+    expected = _run(lambda i, prices, portfolio: _equal_weight(i, prices))
+    res = _run(wrapped)
+    assert res.portfolio.returns() == pytest.approx(expected.portfolio.returns())
+    assert len(res.portfolio.returns()) == len(PRICE_SERIES)
+
+
+def test_jit_strategy_concurrent_backtests():
+    pytest.importorskip("numba")
+    from concurrent.futures import ThreadPoolExecutor
+
+    wrapped = nanobook.jit_strategy(_equal_weight)
+    expected = _run(wrapped).portfolio.returns()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: _run(wrapped).portfolio.returns(), range(16)))
+    assert all(r == expected for r in results)
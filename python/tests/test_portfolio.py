@@ -1,6 +1,7 @@
 """Tests for the Portfolio Python bindings."""
 
 import nanobook
+import pytest
 import tempfile
 import os
 
@@ -34,6 +35,20 @@ def test_portfolio_rebalance_simple():
     assert p.cash < 1_000_000_00  # Some cash spent buying
 
 
+def test_portfolio_rebalance_and_snapshot():
+    cost = nanobook.CostModel(commission_bps=10)
+    fused = nanobook.Portfolio(1_000_000_00, cost)
+    separate = nanobook.Portfolio(1_000_000_00, cost)
+    targets = [("AAPL", 0.5), ("MSFT", 0.25)]
+    prices = [("AAPL", 150_00), ("MSFT", 300_00)]
+
+    snap = fused.rebalance_and_snapshot(targets, prices)
+    separate.rebalance_simple(targets, prices)
+    assert snap == separate.snapshot(prices)
+    assert snap["equity"] == fused.total_equity(prices)
+    assert snap["num_positions"] == 2
+
+
 def test_portfolio_equity():
     p = nanobook.Portfolio(1_000_000_00, nanobook.CostModel.zero())
     equity = p.total_equity([("AAPL", 150_00)])
@@ -50,6 +65,21 @@ def test_portfolio_returns():
     assert returns[0] > 0
 
 
+def test_portfolio_record_return_np_matches_list():
+    np = pytest.importorskip("numpy")
+    a = nanobook.Portfolio(100_00, nanobook.CostModel.zero(), capacity=2)
+    b = nanobook.Portfolio(100_00, nanobook.CostModel.zero())
+    for p in (a, b):
+        p.rebalance_simple([("AAPL", 1.0)], [("AAPL", 10_00)])
+    a.record_return_np(["AAPL"], np.array([11_00], dtype=np.int64))
+    b.record_return([("AAPL", 11_00)])
+    assert a.returns() == b.returns()
+    assert a.returns_np().dtype == np.float64
+    assert a.returns_np().tolist() == b.returns()
+    with pytest.raises(ValueError):
+        a.record_return_np(["AAPL", "MSFT"], np.array([1], dtype=np.int64))
+
+
 def test_portfolio_equity_curve():
     p = nanobook.Portfolio(100_00, nanobook.CostModel.zero())
     curve = p.equity_curve()
@@ -67,6 +97,22 @@ def test_compute_metrics():
     assert "Metrics" in repr(m)
 
 
+def test_compute_metrics_np_matches_list():
+    np = pytest.importorskip("numpy")
+    returns = [0.01, -0.005, 0.02, 0.0, -0.03]
+    expected = nanobook.py_compute_metrics(returns, 252.0, 0.0)
+    for arr in (np.array(returns), np.array(returns * 2)[::2]):
+        m = nanobook.py_compute_metrics_np(arr, 252.0, 0.0)
+        assert m.num_periods == len(arr)
+        assert m.winning_periods == 2
+        assert m.losing_periods == 2
+    m = nanobook.py_compute_metrics_np(np.array(returns), 252.0, 0.0)
+    assert m.sharpe == expected.sharpe
+    assert m.total_return == expected.total_return
+    assert m.profit_factor == expected.profit_factor
+    assert nanobook.py_compute_metrics_np(np.array([], dtype=np.float64)) is None
+
+
 def test_compute_metrics_empty():
     m = nanobook.py_compute_metrics([], 252.0, 0.0)
     assert m is None
@@ -99,6 +145,31 @@ def test_portfolio_save_load():
         os.unlink(path)
 
 
+def test_portfolio_save_load_bin():
+    p = nanobook.Portfolio(1_000_000_00, nanobook.CostModel(commission_bps=10))
+    prices = [("AAPL", 150_00), ("MSFT", 300_00)]
+    p.rebalance_simple([("AAPL", 0.5), ("MSFT", 0.25)], prices)
+    p.record_return(prices)
+
+    with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
+        path = f.name
+
+    try:
+        p.save_bin(path)
+        loaded = nanobook.Portfolio.load_bin(path)
+        assert loaded.cash == p.cash
+        assert loaded.returns() == p.returns()
+        assert loaded.equity_curve() == p.equity_curve()
+        assert loaded.position("MSFT").quantity == p.position("MSFT").quantity
+
+        with open(path, "wb") as f:
+            f.write(b"not a portfolio")
+        with pytest.raises(IOError):
+            nanobook.Portfolio.load_bin(path)
+    finally:
+        os.unlink(path)
+
+
 def test_portfolio_repr():
     p = nanobook.Portfolio(1_000_000_00, nanobook.CostModel.zero())
     assert "Portfolio" in repr(p)
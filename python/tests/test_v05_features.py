@@ -49,6 +49,17 @@ def test_book_snapshot_empty_analytics():
     assert snap.imbalance() is None
     assert snap.weighted_mid() is None
 
+def test_exchange_analytics_match_snapshot():
+    ex = nanobook.Exchange()
+    assert ex.imbalance() is None
+    assert ex.weighted_mid() is None
+    for i in range(4):
+        ex.submit_limit("buy", 10000 - i * 10, 300 + i)
+        ex.submit_limit("sell", 10200 + i * 10, 100 + i)
+    for levels in (1, 2, 10):
+        assert ex.imbalance(levels) == ex.depth(levels).imbalance()
+    assert ex.weighted_mid() == ex.full_book().weighted_mid()
+
 def test_exchange_events_and_replay():
     ex = nanobook.Exchange()
     ex.submit_limit("buy", 10000, 100)
@@ -77,6 +88,38 @@ def test_event_serialization():
     assert isinstance(state, str)
     assert "SubmitLimit" in state
 
+def test_events_pickle_bytes_round_trip():
+    import pickle
+
+    ex = nanobook.Exchange()
+    ex.submit_limit("sell", 10100, 100)
+    ex.submit_limit("buy", 10000, 200)
+    ex.submit_stop_market("buy", 10200, 50)
+    ex.submit_market("buy", 30)
+
+    data = ex.events_pickle_bytes()
+    assert isinstance(data, bytes)
+    assert data.count(b"\n") == len(ex.events())
+
+    ex2 = nanobook.Exchange.replay_pickle_bytes(pickle.loads(pickle.dumps(data)))
+    assert ex2.best_bid_ask() == ex.best_bid_ask()
+    assert len(ex2.trades()) == len(ex.trades())
+    assert ex2.pending_stop_count() == ex.pending_stop_count()
+
+    assert nanobook.Exchange.replay_pickle_bytes(b"").best_bid() is None
+    with pytest.raises(ValueError):
+        nanobook.Exchange.replay_pickle_bytes(b"{not json")
+
+def test_event_state_round_trip():
+    ex = nanobook.Exchange()
+    ex.submit_limit("buy", 10000, 100)
+    ex.cancel(1)
+    for event in ex.events():
+        state = event.__getstate__()
+        other = ex.events()[0]
+        other.__setstate__(state)
+        assert repr(other) == repr(event)
+
 def test_all_event_kinds():
     ex = nanobook.Exchange()
     ex.submit_limit("buy", 10000, 100)
@@ -89,7 +132,10 @@ def test_all_event_kinds():
     ex.submit_trailing_stop_market("buy", 12000, 100, "fixed", 100)
     ex.submit_trailing_stop_limit("sell", 7000, 6900, 100, "percentage", 0.05)
     
-    kinds = [e.kind for e in ex.events()]
+    cols = ex.events_numpy()
+    assert all(len(col) == len(ex.events()) for col in cols.values())
+    kinds = [nanobook.EVENT_KINDS[k] for k in cols["kind"]]
+    assert kinds == [e.kind for e in ex.events()]
     assert "submit_limit" in kinds
     assert "submit_market" in kinds
     assert "cancel" in kinds
@@ -98,6 +144,17 @@ def test_all_event_kinds():
     assert "submit_stop_limit" in kinds
     assert "submit_trailing_stop_market" in kinds
     assert "submit_trailing_stop_limit" in kinds
+    trailing = kinds.index("submit_trailing_stop_market")
+    assert cols["trail_offset"][trailing] == 100
+    assert cols["trail_offset"].dtype == "int64"
+
+def test_event_kind_strings_are_shared():
+    ex = nanobook.Exchange()
+    ex.submit_limit("buy", 10000, 100)
+    ex.submit_limit("buy", 9900, 100)
+    first, second = ex.events()
+    assert first.kind == "submit_limit"
+    assert first.kind is second.kind
 
 def test_stop_order_query():
     ex = nanobook.Exchange()
@@ -189,6 +246,45 @@ def test_multiexchange_complex_forwarding():
     assert ex.best_bid() is None
     assert len(ex.trades()) == 1
 
+def test_multiexchange_batch_forwarding():
+    multi = nanobook.MultiExchange()
+    submitted = multi.submit_limits([
+        ("AAPL", "buy", 10000, 100),
+        ("MSFT", "sell", 30000, 50),
+    ])
+    assert [r.order_id for r in submitted] == [1, 1]
+    assert sorted(multi.symbols()) == ["AAPL", "MSFT"]
+
+    modified = multi.modify_many([("AAPL", 1, 10100, 150)])
+    assert modified[0].success
+    new_id = modified[0].new_order_id
+
+    cancelled = multi.cancel_many([("AAPL", new_id), ("MSFT", 1), ("MSFT", 99)])
+    assert [r.success for r in cancelled] == [True, True, False]
+    assert multi.get_or_create("AAPL").best_bid() is None
+
+
+def test_multiexchange_batch_rejects_before_applying():
+    multi = nanobook.MultiExchange()
+    with pytest.raises(ValueError):
+        multi.submit_limits([
+            ("AAPL", "buy", 10000, 100),
+            ("AAPL", "sideways", 10000, 100),
+        ])
+    assert multi.get_or_create("AAPL").best_bid() is None
+
+
+def test_multiexchange_apply_events():
+    source = nanobook.Exchange()
+    source.submit_limit("sell", 10000, 100, "gtc")
+    source.submit_limit("buy", 10000, 40, "gtc")
+
+    multi = nanobook.MultiExchange()
+    trades = multi.apply_events([("AAPL", e) for e in source.events()])
+    assert trades == 1
+    assert multi.get_or_create("AAPL").best_ask() == 10000
+
+
 def test_run_backtest_callback():
     def constant_strat(bar_index, prices, portfolio):
         return [("AAPL", 1.0)]
@@ -210,6 +306,17 @@ def test_run_backtest_callback():
     assert res.metrics.total_return > 0
     assert "BacktestResult" in repr(res)
 
+def test_run_backtest_prices_refresh_each_bar():
+    seen = []
+
+    def recording_strat(bar_index, prices, portfolio):
+        seen.append(dict(prices))
+        return [("AAPL", 0.5)]
+
+    price_series = [{"AAPL": 100_00, "MSFT": 50_00}, {"AAPL": 110_00}]
+    nanobook.run_backtest(recording_strat, price_series, 100_00, nanobook.CostModel.zero())
+    assert seen == price_series
+
 def test_strategy_exception_handling():
     def breaking_strat(bar_index, prices, portfolio):
         if bar_index == 1:
@@ -284,6 +391,16 @@ def test_multiexchange_len_symbols():
     assert "AAPL" in multi.symbols()
     assert "GOOG" in multi.symbols()
 
+def test_multiexchange_symbol_names_are_cached():
+    multi = nanobook.MultiExchange()
+    multi.submit_limit("AAPL", "sell", 100_00, 10)
+    multi.cancel("AAPL", 1)
+    [first] = multi.symbols()
+    [second] = multi.symbols()
+    assert first == "AAPL"
+    assert first is second
+    assert multi.best_prices()[0][0] is first
+
 def test_book_snapshot_depth_limit():
     ex = nanobook.Exchange()
     for i in range(20):
@@ -295,6 +412,27 @@ def test_book_snapshot_depth_limit():
     full = ex.full_book()
     assert len(full.bids) == 20
 
+def test_book_snapshot_numpy_levels():
+    ex = nanobook.Exchange()
+    for i in range(20):
+        ex.submit_limit("buy", 10000 - i, 10 + i)
+    ex.submit_limit("sell", 10100, 7)
+
+    snap = ex.depth(5)
+    bids = snap.bids_np()
+    assert bids.shape == (5, 2)
+    assert str(bids.dtype) == "int64"
+    assert bids.tolist() == [[l.price, l.quantity] for l in snap.bids]
+    assert snap.asks_np().tolist() == [[10100, 7]]
+
+    empty = nanobook.Exchange().full_book()
+    assert empty.bids_np().shape == (0, 2)
+
+    huge = nanobook.Exchange()
+    huge.submit_limit("buy", 10000, 2**63)
+    with pytest.raises(OverflowError):
+        huge.depth(1).bids_np()
+
 def test_exchange_replay_complex():
     ex = nanobook.Exchange()
     ex.submit_limit("buy", 10000, 100)
@@ -308,6 +446,36 @@ def test_exchange_replay_complex():
     assert replayed.pending_stop_count() == ex.pending_stop_count()
     assert len(replayed.trades()) == len(ex.trades())
 
+    from_columns = nanobook.Exchange.replay_numpy(ex.events_numpy())
+    assert from_columns.best_bid_ask() == ex.best_bid_ask()
+    assert from_columns.pending_stop_count() == ex.pending_stop_count()
+    assert len(from_columns.trades()) == len(ex.trades())
+
+def test_replay_numpy_rejects_bad_columns():
+    ex = nanobook.Exchange()
+    ex.submit_limit("buy", 10000, 100)
+    cols = ex.events_numpy()
+    cols["side"][0] = 7
+    with pytest.raises(ValueError):
+        nanobook.Exchange.replay_numpy(cols)
+    del cols["side"]
+    with pytest.raises(KeyError):
+        nanobook.Exchange.replay_numpy(cols)
+
+def test_replay_numpy_rejects_mismatched_lengths():
+    ex = nanobook.Exchange()
+    ex.submit_limit("buy", 10000, 100)
+    ex.submit_limit("sell", 10100, 100)
+    cols = ex.events_numpy()
+    cols["price"] = cols["price"][:1]
+    with pytest.raises(ValueError, match="price"):
+        nanobook.Exchange.replay_numpy(cols)
+
+    cols = ex.events_numpy()
+    cols["quantity"] = cols["quantity"].repeat(2)
+    with pytest.raises(ValueError, match="quantity"):
+        nanobook.Exchange.replay_numpy(cols)
+
 def test_exchange_clear_trades_and_history():
     ex = nanobook.Exchange()
     ex.submit_limit("sell", 10000, 100)
@@ -10,6 +10,7 @@ use crate::portfolio::metrics::{
 };
 use crate::portfolio::{CostModel, Portfolio};
 use crate::types::Symbol;
+use rustc_hash::FxHashMap;
 
 /// Optional stop simulation configuration.
 #[derive(Clone, Debug, Default)]
@@ -172,7 +173,8 @@ pub fn backtest_weights_with_options(
         min_trade_fee: 0,
     };
 
-    let mut portfolio = Portfolio::new(initial_cash_cents, cost_model);
+    let mut portfolio =
+        Portfolio::with_capacity(initial_cash_cents, cost_model, weight_schedule.len());
     let mut equity_curve = Vec::with_capacity(weight_schedule.len() + 1);
     equity_curve.push(initial_cash_cents);
 
@@ -209,7 +211,8 @@ pub fn backtest_weights_with_options(
         symbol_returns.push(period_symbol_returns);
 
         // Rebalance to target weights first.
-        portfolio.rebalance_simple(weights, prices);
+        let fx_prices: FxHashMap<Symbol, i64> = prices.iter().copied().collect();
+        portfolio.rebalance_simple_from_price_map(weights, &fx_prices);
 
         // Optional stop simulation runs after target rebalance on each bar.
         if let Some(cfg) = stop_cfg.as_ref() {
@@ -223,16 +226,15 @@ pub fn backtest_weights_with_options(
             );
         }
 
-        // Record return for this period.
-        portfolio.record_return(prices);
+        // Record return, holdings, and equity from one pass over positions.
+        let snapshot = portfolio.snapshot_from_price_map(&fx_prices);
+        portfolio.record_equity(snapshot.equity);
 
-        // Track holdings and equity.
-        let mut period_holdings = portfolio.current_weights(prices);
+        let mut period_holdings = snapshot.weights;
         period_holdings.sort_by_key(|(sym, _)| *sym);
         holdings.push(period_holdings);
 
-        let equity = portfolio.total_equity(prices);
-        equity_curve.push(equity);
+        equity_curve.push(snapshot.equity);
 
         prev_prices = price_map;
     }
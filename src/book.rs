@@ -7,7 +7,13 @@
 
 use rustc_hash::FxHashMap;
 
-use crate::{Order, OrderId, Price, PriceLevels, Quantity, Side, TimeInForce, Timestamp, TradeId};
+use crate::{
+    Level, Order, OrderId, Price, PriceLevels, Quantity, Side, TimeInForce, Timestamp, TradeId,
+};
+
+/// A level is compacted on cancel once it holds at least this many
+/// tombstones and more tombstones than live orders.
+const AUTO_COMPACT_MIN_TOMBSTONES: usize = 32;
 
 // Re-import for tests only
 #[cfg(test)]
@@ -45,7 +51,11 @@ pub struct OrderBook {
     bids: PriceLevels,
     /// Sell orders, sorted by price ascending (best = lowest)
     asks: PriceLevels,
-    /// All orders indexed by ID (includes filled/cancelled for history)
+    /// All orders indexed by ID (includes filled/cancelled for history).
+    ///
+    /// FxHash rather than an identity hasher: the std SwissTable takes its
+    /// 7-bit control tag from the hash's top bits, which are all zero for
+    /// sequential IDs and would make every probe a tag match.
     pub(crate) orders: FxHashMap<OrderId, Order>,
     /// Next order ID to assign
     next_order_id: u64,
@@ -258,6 +268,20 @@ impl OrderBook {
         // Mark as tombstone in price level (O(1))
         self.side_mut(side).mark_tombstone(price, index, remaining);
 
+        // Reclaim the queue once cancels dominate it, so churn at one price
+        // does not grow it without bound. Amortized O(1) per cancel.
+        let levels = match side {
+            Side::Buy => &mut self.bids,
+            Side::Sell => &mut self.asks,
+        };
+        if let Some(level) = levels.get_level_mut(price)
+            && level.tombstone_count() >= AUTO_COMPACT_MIN_TOMBSTONES
+            && level.tombstone_count() > level.order_count()
+        {
+            level.compact();
+            renumber(level, &mut self.orders);
+        }
+
         Some(remaining)
     }
 
@@ -298,6 +322,22 @@ impl OrderBook {
     pub fn compact(&mut self) {
         self.bids.compact();
         self.asks.compact();
+        for (_, level) in self.bids.iter_best_to_worst() {
+            renumber(level, &mut self.orders);
+        }
+        for (_, level) in self.asks.iter_best_to_worst() {
+            renumber(level, &mut self.orders);
+        }
+    }
+}
+
+/// Write each live order's current queue position back to the order index
+/// after its level was compacted.
+fn renumber(level: &Level, orders: &mut FxHashMap<OrderId, Order>) {
+    for (position, id) in level.positions() {
+        if let Some(order) = orders.get_mut(&id) {
+            order.position_in_level = position;
+        }
     }
 }
 
@@ -163,6 +163,300 @@ impl Event {
     }
 }
 
+impl Event {
+    /// Snake-case event names, indexed by [`Event::kind_code`].
+    pub const KIND_NAMES: [&'static str; 8] = [
+        "submit_limit",
+        "submit_market",
+        "cancel",
+        "modify",
+        "submit_stop_market",
+        "submit_stop_limit",
+        "submit_trailing_stop_market",
+        "submit_trailing_stop_limit",
+    ];
+
+    /// Dense numeric code for the event variant (index into
+    /// [`Event::KIND_NAMES`]).
+    #[inline]
+    pub fn kind_code(&self) -> u8 {
+        match self {
+            Event::SubmitLimit { .. } => 0,
+            Event::SubmitMarket { .. } => 1,
+            Event::Cancel { .. } => 2,
+            Event::Modify { .. } => 3,
+            Event::SubmitStopMarket { .. } => 4,
+            Event::SubmitStopLimit { .. } => 5,
+            Event::SubmitTrailingStopMarket { .. } => 6,
+            Event::SubmitTrailingStopLimit { .. } => 7,
+        }
+    }
+
+    /// Snake-case name of the event variant (e.g. `"submit_limit"`).
+    #[inline]
+    pub fn kind(&self) -> &'static str {
+        Self::KIND_NAMES[self.kind_code() as usize]
+    }
+}
+
+/// Column-oriented (structure-of-arrays) copy of an event log.
+///
+/// One entry per event in every column, so analytics can scan a single
+/// field without touching the others. Fields that a variant does not
+/// carry are zero. Codes:
+///
+/// - `kind`: [`Event::kind_code`]
+/// - `side`: 0 = buy, 1 = sell
+/// - `time_in_force`: 0 = GTC, 1 = IOC, 2 = FOK
+/// - `trail_type`: 0 = fixed, 1 = percentage, 2 = sma_abs_change
+///
+/// `price` holds the limit price (or `new_price` for a modify);
+/// `stop_price` holds the trigger price of stop events. A fixed trail
+/// offset is stored exactly in `trail_offset`; `trail_value` holds the
+/// percentage or SMA multiplier.
+///
+/// ```
+/// use nanobook::{Event, EventColumns, Price, Side, TimeInForce};
+///
+/// let events = vec![Event::submit_limit(Side::Sell, Price(100_00), 10, TimeInForce::GTC)];
+/// let columns = EventColumns::from_events(&events);
+/// assert_eq!(columns.price, vec![100_00]);
+/// assert_eq!(columns.to_events(), Ok(events));
+/// ```
+#[derive(Clone, Debug, Default, PartialEq)]
+pub struct EventColumns {
+    pub kind: Vec<u8>,
+    pub side: Vec<u8>,
+    pub price: Vec<i64>,
+    pub stop_price: Vec<i64>,
+    pub quantity: Vec<u64>,
+    pub order_id: Vec<u64>,
+    pub time_in_force: Vec<u8>,
+    pub trail_type: Vec<u8>,
+    pub trail_offset: Vec<i64>,
+    pub trail_value: Vec<f64>,
+    pub trail_period: Vec<u64>,
+}
+
+impl EventColumns {
+    /// Create empty columns with room for `capacity` events.
+    pub fn with_capacity(capacity: usize) -> Self {
+        Self {
+            kind: Vec::with_capacity(capacity),
+            side: Vec::with_capacity(capacity),
+            price: Vec::with_capacity(capacity),
+            stop_price: Vec::with_capacity(capacity),
+            quantity: Vec::with_capacity(capacity),
+            order_id: Vec::with_capacity(capacity),
+            time_in_force: Vec::with_capacity(capacity),
+            trail_type: Vec::with_capacity(capacity),
+            trail_offset: Vec::with_capacity(capacity),
+            trail_value: Vec::with_capacity(capacity),
+            trail_period: Vec::with_capacity(capacity),
+        }
+    }
+
+    /// Split an event slice into columns in a single pass.
+    pub fn from_events(events: &[Event]) -> Self {
+        let mut columns = Self::with_capacity(events.len());
+        for event in events {
+            columns.push(event);
+        }
+        columns
+    }
+
+    /// Number of events (rows).
+    pub fn len(&self) -> usize {
+        self.kind.len()
+    }
+
+    /// Returns true if there are no events.
+    pub fn is_empty(&self) -> bool {
+        self.kind.is_empty()
+    }
+
+    /// Check that every column has as many rows as `kind`.
+    ///
+    /// `Err` names the first column whose length differs. Call this before
+    /// [`EventColumns::to_events`] on columns built outside this crate:
+    /// `to_events` reads `len()` rows, so a longer column would be silently
+    /// truncated and a shorter one reported as an invalid row.
+    pub fn validate(&self) -> Result<(), &'static str> {
+        let rows = self.len();
+        let lengths = [
+            ("side", self.side.len()),
+            ("price", self.price.len()),
+            ("stop_price", self.stop_price.len()),
+            ("quantity", self.quantity.len()),
+            ("order_id", self.order_id.len()),
+            ("time_in_force", self.time_in_force.len()),
+            ("trail_type", self.trail_type.len()),
+            ("trail_offset", self.trail_offset.len()),
+            ("trail_value", self.trail_value.len()),
+            ("trail_period", self.trail_period.len()),
+        ];
+        match lengths.iter().find(|(_, len)| *len != rows) {
+            Some((name, _)) => Err(name),
+            None => Ok(()),
+        }
+    }
+
+    /// Append one event as a new row.
+    pub fn push(&mut self, event: &Event) {
+        let (mut side, mut price, mut stop_price, mut quantity, mut order_id) =
+            (Side::Buy, Price::ZERO, Price::ZERO, 0, OrderId(0));
+        let mut tif = TimeInForce::GTC;
+        let mut trail = None;
+        match event {
+            Event::SubmitLimit {
+                side: s,
+                price: p,
+                quantity: q,
+                time_in_force: t,
+            } => (side, price, quantity, tif) = (*s, *p, *q, *t),
+            Event::SubmitMarket {
+                side: s,
+                quantity: q,
+            } => (side, quantity) = (*s, *q),
+            Event::Cancel { order_id: id } => order_id = *id,
+            Event::Modify {
+                order_id: id,
+                new_price,
+                new_quantity,
+            } => (order_id, price, quantity) = (*id, *new_price, *new_quantity),
+            Event::SubmitStopMarket {
+                side: s,
+                stop_price: sp,
+                quantity: q,
+            } => (side, stop_price, quantity) = (*s, *sp, *q),
+            Event::SubmitStopLimit {
+                side: s,
+                stop_price: sp,
+                limit_price,
+                quantity: q,
+                time_in_force: t,
+            } => (side, stop_price, price, quantity, tif) = (*s, *sp, *limit_price, *q, *t),
+            Event::SubmitTrailingStopMarket {
+                side: s,
+                stop_price: sp,
+                quantity: q,
+                trail_method,
+            } => {
+                (side, stop_price, quantity) = (*s, *sp, *q);
+                trail = Some(trail_method);
+            }
+            Event::SubmitTrailingStopLimit {
+                side: s,
+                stop_price: sp,
+                limit_price,
+                quantity: q,
+                time_in_force: t,
+                trail_method,
+            } => {
+                (side, stop_price, price, quantity, tif) = (*s, *sp, *limit_price, *q, *t);
+                trail = Some(trail_method);
+            }
+        }
+        let (trail_type, trail_offset, trail_value, trail_period) = match trail {
+            None => (0, 0, 0.0, 0),
+            Some(TrailMethod::Fixed(offset)) => (0, *offset, 0.0, 0),
+            Some(TrailMethod::Percentage(pct)) => (1, 0, *pct, 0),
+            Some(TrailMethod::SmaAbsChange { multiplier, period }) => {
+                (2, 0, *multiplier, *period as u64)
+            }
+        };
+
+        self.kind.push(event.kind_code());
+        self.side.push(side_code(side));
+        self.price.push(price.0);
+        self.stop_price.push(stop_price.0);
+        self.quantity.push(quantity);
+        self.order_id.push(order_id.0);
+        self.time_in_force.push(tif_code(tif));
+        self.trail_type.push(trail_type);
+        self.trail_offset.push(trail_offset);
+        self.trail_value.push(trail_value);
+        self.trail_period.push(trail_period);
+    }
+
+    /// Decode row `row` back into an [`Event`].
+    ///
+    /// Returns `None` if `row` is out of range in any column or a code
+    /// column holds a value outside its documented range.
+    pub fn event(&self, row: usize) -> Option<Event> {
+        let side = match *self.side.get(row)? {
+            0 => Side::Buy,
+            1 => Side::Sell,
+            _ => return None,
+        };
+        let time_in_force = match *self.time_in_force.get(row)? {
+            0 => TimeInForce::GTC,
+            1 => TimeInForce::IOC,
+            2 => TimeInForce::FOK,
+            _ => return None,
+        };
+        let price = Price(*self.price.get(row)?);
+        let stop_price = Price(*self.stop_price.get(row)?);
+        let quantity = *self.quantity.get(row)?;
+        let order_id = OrderId(*self.order_id.get(row)?);
+        let trail_offset = *self.trail_offset.get(row)?;
+        let trail_value = *self.trail_value.get(row)?;
+        let trail_method = match *self.trail_type.get(row)? {
+            0 => TrailMethod::Fixed(trail_offset),
+            1 => TrailMethod::Percentage(trail_value),
+            2 => TrailMethod::SmaAbsChange {
+                multiplier: trail_value,
+                period: usize::try_from(*self.trail_period.get(row)?).ok()?,
+            },
+            _ => return None,
+        };
+
+        Some(match *self.kind.get(row)? {
+            0 => Event::submit_limit(side, price, quantity, time_in_force),
+            1 => Event::submit_market(side, quantity),
+            2 => Event::cancel(order_id),
+            3 => Event::modify(order_id, price, quantity),
+            4 => Event::submit_stop_market(side, stop_price, quantity),
+            5 => Event::submit_stop_limit(side, stop_price, price, quantity, time_in_force),
+            6 => Event::submit_trailing_stop_market(side, stop_price, quantity, trail_method),
+            7 => Event::submit_trailing_stop_limit(
+                side,
+                stop_price,
+                price,
+                quantity,
+                time_in_force,
+                trail_method,
+            ),
+            _ => return None,
+        })
+    }
+
+    /// Decode every row back into events.
+    ///
+    /// `Err(row)` names the first row that does not decode (see
+    /// [`EventColumns::event`]).
+    pub fn to_events(&self) -> Result<Vec<Event>, usize> {
+        (0..self.len())
+            .map(|row| self.event(row).ok_or(row))
+            .collect()
+    }
+}
+
+fn side_code(side: Side) -> u8 {
+    match side {
+        Side::Buy => 0,
+        Side::Sell => 1,
+    }
+}
+
+fn tif_code(tif: TimeInForce) -> u8 {
+    match tif {
+        TimeInForce::GTC => 0,
+        TimeInForce::IOC => 1,
+        TimeInForce::FOK => 2,
+    }
+}
+
 /// Result of applying an event.
 #[derive(Clone, Debug)]
 #[cfg_attr(feature = "serde", derive(serde::Serialize, serde::Deserialize))]
@@ -543,6 +837,114 @@ mod tests {
         assert_eq!(replayed.last_trade_price(), original.last_trade_price());
     }
 
+    fn all_kinds() -> Vec<Event> {
+        vec![
+            Event::submit_limit(Side::Buy, Price(100_00), 100, TimeInForce::IOC),
+            Event::submit_market(Side::Sell, 50),
+            Event::cancel(OrderId(1)),
+            Event::modify(OrderId(4), Price(91_00), 200),
+            Event::submit_stop_market(Side::Buy, Price(110_00), 100),
+            Event::submit_stop_limit(
+                Side::Sell,
+                Price(80_00),
+                Price(79_00),
+                100,
+                TimeInForce::FOK,
+            ),
+            Event::submit_trailing_stop_market(
+                Side::Buy,
+                Price(120_00),
+                100,
+                TrailMethod::Fixed(100),
+            ),
+            Event::submit_trailing_stop_limit(
+                Side::Sell,
+                Price(70_00),
+                Price(69_00),
+                100,
+                TimeInForce::GTC,
+                TrailMethod::SmaAbsChange {
+                    multiplier: 2.0,
+                    period: 14,
+                },
+            ),
+        ]
+    }
+
+    #[test]
+    fn kind_codes_match_names() {
+        for (code, event) in all_kinds().iter().enumerate() {
+            assert_eq!(event.kind_code() as usize, code);
+            assert_eq!(event.kind(), Event::KIND_NAMES[code]);
+        }
+    }
+
+    #[test]
+    fn event_columns_round_trip() {
+        let events = all_kinds();
+        let columns = EventColumns::from_events(&events);
+
+        assert_eq!(columns.len(), events.len());
+        assert_eq!(columns.kind, vec![0, 1, 2, 3, 4, 5, 6, 7]);
+        assert_eq!(columns.order_id[2], 1);
+        assert_eq!(columns.price[3], 91_00);
+        assert_eq!(columns.stop_price[5], 80_00);
+        assert_eq!(columns.trail_period[7], 14);
+        assert_eq!(columns.to_events(), Ok(events));
+    }
+
+    #[test]
+    fn event_columns_keep_large_fixed_offsets_exact() {
+        // 2^53 + 1 is not representable as f64.
+        let offset = (1_i64 << 53) + 1;
+        let events = vec![Event::submit_trailing_stop_market(
+            Side::Sell,
+            Price(100_00),
+            10,
+            TrailMethod::Fixed(offset),
+        )];
+        let columns = EventColumns::from_events(&events);
+        assert_eq!(columns.trail_offset, vec![offset]);
+        assert_eq!(columns.to_events(), Ok(events));
+    }
+
+    #[test]
+    fn event_columns_reject_bad_codes() {
+        let mut columns = EventColumns::from_events(&all_kinds());
+        columns.side[1] = 9;
+        assert_eq!(columns.to_events(), Err(1));
+
+        columns.side[1] = 1;
+        columns.kind.push(42);
+        assert_eq!(columns.event(8), None);
+    }
+
+    #[test]
+    fn event_columns_validate_lengths() {
+        let mut columns = EventColumns::from_events(&all_kinds());
+        assert_eq!(columns.validate(), Ok(()));
+
+        columns.trail_value.push(0.0);
+        assert_eq!(columns.validate(), Err("trail_value"));
+
+        columns.trail_value.pop();
+        columns.price.pop();
+        assert_eq!(columns.validate(), Err("price"));
+    }
+
+    #[test]
+    fn event_columns_replay_matches_original() {
+        let mut original = Exchange::new();
+        original.submit_limit(Side::Sell, Price(101_00), 100, TimeInForce::GTC);
+        original.submit_limit(Side::Buy, Price(100_00), 100, TimeInForce::GTC);
+        original.submit_market(Side::Buy, 50);
+
+        let columns = EventColumns::from_events(original.events());
+        let replayed = Exchange::replay(&columns.to_events().unwrap());
+        assert_eq!(original.best_bid_ask(), replayed.best_bid_ask());
+        assert_eq!(original.trades().len(), replayed.trades().len());
+    }
+
     #[test]
     fn events_are_equal() {
         let e1 = Event::submit_limit(Side::Buy, Price(100_00), 100, TimeInForce::GTC);
@@ -736,6 +736,17 @@ impl Exchange {
         self.book.snapshot(levels)
     }
 
+    /// Imbalance over the top `levels` of each side, without building a
+    /// snapshot. Equal to `self.depth(levels).imbalance()`.
+    pub fn imbalance(&self, levels: usize) -> Option<f64> {
+        self.book.imbalance(levels)
+    }
+
+    /// Top-of-book volume-weighted midpoint, without building a snapshot.
+    pub fn weighted_mid(&self) -> Option<f64> {
+        self.book.weighted_mid()
+    }
+
     /// Get a full snapshot of the order book.
     pub fn full_book(&self) -> BookSnapshot {
         self.book.full_snapshot()
@@ -1501,4 +1512,58 @@ mod tests {
             "compact must remove the tombstone",
         );
     }
+
+    /// Queue positions used to shift when a fill popped the front of a
+    /// level, so a later cancel tombstoned the wrong order and the next
+    /// sweep spun on the stale entry.
+    #[test]
+    fn cancel_after_front_fill_hits_the_right_order() {
+        let mut exchange = Exchange::new();
+        exchange.submit_limit(Side::Buy, Price(100_00), 100, TimeInForce::GTC);
+        let b = exchange.submit_limit(Side::Buy, Price(100_00), 100, TimeInForce::GTC);
+        let c = exchange.submit_limit(Side::Buy, Price(100_00), 100, TimeInForce::GTC);
+
+        exchange.submit_limit(Side::Sell, Price(100_00), 100, TimeInForce::GTC);
+        assert!(exchange.cancel(b.order_id).success);
+
+        let level = exchange.book().bids().get_level(Price(100_00)).unwrap();
+        assert_eq!(level.iter().collect::<Vec<_>>(), vec![c.order_id]);
+        assert_eq!(level.total_quantity(), 100);
+
+        let sweep = exchange.submit_limit(Side::Sell, Price(100_00), 100, TimeInForce::GTC);
+        assert_eq!(sweep.trades.len(), 1);
+        assert_eq!(sweep.trades[0].passive_order_id, c.order_id);
+    }
+
+    #[test]
+    fn cancel_after_compact_hits_the_right_order() {
+        let mut exchange = Exchange::new();
+        let a = exchange.submit_limit(Side::Sell, Price(101_00), 10, TimeInForce::GTC);
+        let b = exchange.submit_limit(Side::Sell, Price(101_00), 20, TimeInForce::GTC);
+        let c = exchange.submit_limit(Side::Sell, Price(101_00), 30, TimeInForce::GTC);
+        exchange.cancel(a.order_id);
+        exchange.compact();
+
+        assert!(exchange.cancel(c.order_id).success);
+        let level = exchange.book().asks().get_level(Price(101_00)).unwrap();
+        assert_eq!(level.iter().collect::<Vec<_>>(), vec![b.order_id]);
+        assert_eq!(level.total_quantity(), 20);
+    }
+
+    #[test]
+    fn cancel_churn_keeps_level_queue_bounded() {
+        let mut exchange = Exchange::new();
+        let anchor = exchange.submit_limit(Side::Buy, Price(100_00), 1, TimeInForce::GTC);
+        for _ in 0..1_000 {
+            let r = exchange.submit_limit(Side::Buy, Price(100_00), 5, TimeInForce::GTC);
+            assert!(exchange.cancel(r.order_id).success);
+        }
+
+        let level = exchange.book().bids().get_level(Price(100_00)).unwrap();
+        assert!(level.raw_len() <= 64, "raw_len = {}", level.raw_len());
+        assert_eq!(level.iter().collect::<Vec<_>>(), vec![anchor.order_id]);
+
+        assert!(exchange.cancel(anchor.order_id).success);
+        assert_eq!(exchange.best_bid(), None);
+    }
 }
@@ -1,7 +1,9 @@
 //! NASDAQ ITCH 5.0 parser and nanobook Event conversion.
 
 use crate::{Event, OrderId, Price, Side, TimeInForce};
-use std::io::{Error, ErrorKind, Read, Result};
+use std::collections::HashMap;
+use std::io::{BufReader, Error, ErrorKind, Read, Result};
+use std::path::Path;
 
 /// Construct an `InvalidData` error with a short static message.
 ///
@@ -117,14 +119,18 @@ pub enum ItchMessage {
 /// Parser for ITCH 5.0 binary format.
 pub struct ItchParser<R: Read> {
     reader: R,
-    stock_locates: std::collections::HashMap<u16, String>,
+    stock_locates: HashMap<u16, String>,
+    /// Message body scratch, reused across frames (lengths are u16, so
+    /// it never grows past 64 KiB).
+    msg_buf: Vec<u8>,
 }
 
 impl<R: Read> ItchParser<R> {
     pub fn new(reader: R) -> Self {
         Self {
             reader,
-            stock_locates: std::collections::HashMap::new(),
+            stock_locates: HashMap::new(),
+            msg_buf: Vec::new(),
         }
     }
 
@@ -153,149 +159,225 @@ impl<R: Read> ItchParser<R> {
             ));
         }
 
-        let mut msg_buf = vec![0u8; len];
-        self.reader.read_exact(&mut msg_buf)?;
-
-        let msg_type = msg_buf[0] as char;
-        let payload = &msg_buf[1..];
-
-        // Minimum payload sizes per ITCH 5.0 spec (bytes after message
-        // type). This gate is a fast-fail with a clear, type-scoped
-        // error message. The per-field reads below are individually
-        // fallible, so the parser remains correct even if this table
-        // is out of sync with a message layout — the per-field errors
-        // kick in and no panic occurs.
-        let min_payload = match msg_type {
-            'A' | 'F' => 35, // ..payload[31..35]
-            'E' => 30,       // ..payload[22..30]
-            'C' => 35,       // ..payload[31..35]
-            'X' => 22,       // ..payload[18..22]
-            'D' => 18,       // ..payload[10..18]
-            'U' => 34,       // ..payload[30..34]
-            'P' => 43,       // ..payload[35..43]
-            'R' => 10,       // ..payload[2..10]
-            _ => 0,
+        self.msg_buf.resize(len, 0);
+        self.reader.read_exact(&mut self.msg_buf)?;
+
+        decode_message(&self.msg_buf, &mut self.stock_locates).map(Some)
+    }
+}
+
+/// Parser for ITCH 5.0 frames that are already in memory.
+///
+/// Same framing and error contract as [`ItchParser`], but each message
+/// is decoded straight out of the borrowed buffer — no per-message
+/// `Vec<u8>` and no `Read` indirection. Use it for byte strings handed
+/// over from Python and for memory-mapped files.
+pub struct ItchSliceParser<'a> {
+    buf: &'a [u8],
+    pos: usize,
+    stock_locates: HashMap<u16, String>,
+}
+
+impl<'a> ItchSliceParser<'a> {
+    pub fn new(buf: &'a [u8]) -> Self {
+        Self {
+            buf,
+            pos: 0,
+            stock_locates: HashMap::new(),
+        }
+    }
+
+    /// Decode the next message from the buffer.
+    ///
+    /// Returns `Ok(None)` once fewer than two bytes (a full length
+    /// prefix) remain, mirroring the EOF behavior of
+    /// [`ItchParser::next_message`]. A length prefix that runs past the
+    /// end of the buffer is an `UnexpectedEof` error, as `read_exact`
+    /// reports for the streaming parser.
+    pub fn next_message(&mut self) -> Result<Option<ItchMessage>> {
+        let rest = &self.buf[self.pos..];
+        let Some(len_bytes) = rest.get(..2) else {
+            return Ok(None);
         };
-        if payload.len() < min_payload {
+        let len = u16::from_be_bytes([len_bytes[0], len_bytes[1]]) as usize;
+        if len == 0 {
             return Err(Error::new(
                 ErrorKind::InvalidData,
-                format!(
-                    "ITCH '{}' message too short: {} bytes, need {}",
-                    msg_type,
-                    payload.len(),
-                    min_payload,
-                ),
+                "ITCH message length is 0",
             ));
         }
 
-        match msg_type {
-            'A' | 'F' => {
-                let timestamp = read_u48_be(&payload[4..10], "A/F.timestamp")?;
-                let order_ref = read_u64_be(&payload[10..18], "A/F.order_ref")?;
-                let side = if payload[18] == b'B' {
-                    Side::Buy
-                } else {
-                    Side::Sell
-                };
-                let shares = read_u32_be(&payload[19..23], "A/F.shares")?;
-                let stock = String::from_utf8_lossy(&payload[23..31]).trim().to_string();
-                let price = read_u32_be(&payload[31..35], "A/F.price")?;
-                Ok(Some(ItchMessage::AddOrder {
-                    timestamp,
-                    order_ref,
-                    side,
-                    shares,
-                    stock,
-                    price,
-                }))
-            }
-            'E' => {
-                let timestamp = read_u48_be(&payload[4..10], "E.timestamp")?;
-                let order_ref = read_u64_be(&payload[10..18], "E.order_ref")?;
-                let shares = read_u32_be(&payload[18..22], "E.shares")?;
-                let match_number = read_u64_be(&payload[22..30], "E.match_number")?;
-                Ok(Some(ItchMessage::OrderExecuted {
-                    timestamp,
-                    order_ref,
-                    shares,
-                    match_number,
-                }))
-            }
-            'C' => {
-                let timestamp = read_u48_be(&payload[4..10], "C.timestamp")?;
-                let order_ref = read_u64_be(&payload[10..18], "C.order_ref")?;
-                let shares = read_u32_be(&payload[18..22], "C.shares")?;
-                let match_number = read_u64_be(&payload[22..30], "C.match_number")?;
-                let printable = payload[30] == b'Y';
-                let price = read_u32_be(&payload[31..35], "C.price")?;
-                Ok(Some(ItchMessage::OrderExecutedWithPrice {
-                    timestamp,
-                    order_ref,
-                    shares,
-                    match_number,
-                    printable,
-                    price,
-                }))
-            }
-            'X' => {
-                let timestamp = read_u48_be(&payload[4..10], "X.timestamp")?;
-                let order_ref = read_u64_be(&payload[10..18], "X.order_ref")?;
-                let shares = read_u32_be(&payload[18..22], "X.shares")?;
-                Ok(Some(ItchMessage::OrderCancel {
-                    timestamp,
-                    order_ref,
-                    shares,
-                }))
-            }
-            'D' => {
-                let timestamp = read_u48_be(&payload[4..10], "D.timestamp")?;
-                let order_ref = read_u64_be(&payload[10..18], "D.order_ref")?;
-                Ok(Some(ItchMessage::OrderDelete {
-                    timestamp,
-                    order_ref,
-                }))
-            }
-            'U' => {
-                let timestamp = read_u48_be(&payload[4..10], "U.timestamp")?;
-                let old_order_ref = read_u64_be(&payload[10..18], "U.old_order_ref")?;
-                let new_order_ref = read_u64_be(&payload[18..26], "U.new_order_ref")?;
-                let shares = read_u32_be(&payload[26..30], "U.shares")?;
-                let price = read_u32_be(&payload[30..34], "U.price")?;
-                Ok(Some(ItchMessage::OrderReplace {
-                    timestamp,
-                    old_order_ref,
-                    new_order_ref,
-                    shares,
-                    price,
-                }))
-            }
-            'P' => {
-                let timestamp = read_u48_be(&payload[4..10], "P.timestamp")?;
-                let side = match payload[18] {
-                    b'B' => Side::Buy,
-                    _ => Side::Sell,
-                };
-                let shares = read_u32_be(&payload[19..23], "P.shares")?;
-                let stock = String::from_utf8_lossy(&payload[23..31]).trim().to_string();
-                let price = read_u32_be(&payload[31..35], "P.price")?;
-                let match_number = read_u64_be(&payload[35..43], "P.match_number")?;
-                Ok(Some(ItchMessage::Trade {
-                    timestamp,
-                    side,
-                    shares,
-                    stock,
-                    price,
-                    match_number,
-                }))
-            }
-            'R' => {
-                let locate = read_u16_be(&payload[0..2], "R.locate")?;
-                let stock = String::from_utf8_lossy(&payload[2..10]).trim().to_string();
-                self.stock_locates.insert(locate, stock.clone());
-                Ok(Some(ItchMessage::StockDirectory { stock, locate }))
-            }
-            _ => Ok(Some(ItchMessage::Other(msg_type))),
+        let msg_buf = rest.get(2..2 + len).ok_or_else(|| {
+            Error::new(
+                ErrorKind::UnexpectedEof,
+                format!(
+                    "ITCH message truncated: length prefix {} bytes, {} available",
+                    len,
+                    rest.len() - 2,
+                ),
+            )
+        })?;
+        self.pos += 2 + len;
+
+        decode_message(msg_buf, &mut self.stock_locates).map(Some)
+    }
+}
+
+/// Minimum payload size (bytes after the type byte) per ITCH 5.0
+/// message type, indexed by the type byte. Types the decoder does not
+/// read fields from map to 0.
+///
+/// A table lookup replaces a second `match` on the type byte ahead of
+/// the decode `match`, keeping the length gate to one load and compare.
+static MIN_PAYLOAD: [u8; 256] = {
+    let mut t = [0u8; 256];
+    t[b'A' as usize] = 35; // ..payload[31..35]
+    t[b'F' as usize] = 35; // ..payload[31..35]
+    t[b'E' as usize] = 30; // ..payload[22..30]
+    t[b'C' as usize] = 35; // ..payload[31..35]
+    t[b'X' as usize] = 22; // ..payload[18..22]
+    t[b'D' as usize] = 18; // ..payload[10..18]
+    t[b'U' as usize] = 34; // ..payload[30..34]
+    t[b'P' as usize] = 43; // ..payload[35..43]
+    t[b'R' as usize] = 10; // ..payload[2..10]
+    t
+};
+
+/// Decode one ITCH message body (type byte + payload, without the
+/// 2-byte length prefix).
+///
+/// Shared by [`ItchParser`] and [`ItchSliceParser`] so both framings
+/// apply the same per-type length gate and fallible field reads.
+/// `msg_buf` must be non-empty; both callers reject a zero length
+/// prefix before getting here.
+fn decode_message(msg_buf: &[u8], stock_locates: &mut HashMap<u16, String>) -> Result<ItchMessage> {
+    let msg_type = msg_buf[0] as char;
+    let payload = &msg_buf[1..];
+
+    // Fast-fail with a clear, type-scoped error message. The per-field
+    // reads below are individually fallible, so the parser remains
+    // correct even if `MIN_PAYLOAD` is out of sync with a message
+    // layout — the per-field errors kick in and no panic occurs.
+    let min_payload = MIN_PAYLOAD[msg_buf[0] as usize] as usize;
+    if payload.len() < min_payload {
+        return Err(Error::new(
+            ErrorKind::InvalidData,
+            format!(
+                "ITCH '{}' message too short: {} bytes, need {}",
+                msg_type,
+                payload.len(),
+                min_payload,
+            ),
+        ));
+    }
+
+    match msg_type {
+        'A' | 'F' => {
+            let timestamp = read_u48_be(&payload[4..10], "A/F.timestamp")?;
+            let order_ref = read_u64_be(&payload[10..18], "A/F.order_ref")?;
+            let side = if payload[18] == b'B' {
+                Side::Buy
+            } else {
+                Side::Sell
+            };
+            let shares = read_u32_be(&payload[19..23], "A/F.shares")?;
+            let stock = String::from_utf8_lossy(&payload[23..31]).trim().to_string();
+            let price = read_u32_be(&payload[31..35], "A/F.price")?;
+            Ok(ItchMessage::AddOrder {
+                timestamp,
+                order_ref,
+                side,
+                shares,
+                stock,
+                price,
+            })
+        }
+        'E' => {
+            let timestamp = read_u48_be(&payload[4..10], "E.timestamp")?;
+            let order_ref = read_u64_be(&payload[10..18], "E.order_ref")?;
+            let shares = read_u32_be(&payload[18..22], "E.shares")?;
+            let match_number = read_u64_be(&payload[22..30], "E.match_number")?;
+            Ok(ItchMessage::OrderExecuted {
+                timestamp,
+                order_ref,
+                shares,
+                match_number,
+            })
+        }
+        'C' => {
+            let timestamp = read_u48_be(&payload[4..10], "C.timestamp")?;
+            let order_ref = read_u64_be(&payload[10..18], "C.order_ref")?;
+            let shares = read_u32_be(&payload[18..22], "C.shares")?;
+            let match_number = read_u64_be(&payload[22..30], "C.match_number")?;
+            let printable = payload[30] == b'Y';
+            let price = read_u32_be(&payload[31..35], "C.price")?;
+            Ok(ItchMessage::OrderExecutedWithPrice {
+                timestamp,
+                order_ref,
+                shares,
+                match_number,
+                printable,
+                price,
+            })
+        }
+        'X' => {
+            let timestamp = read_u48_be(&payload[4..10], "X.timestamp")?;
+            let order_ref = read_u64_be(&payload[10..18], "X.order_ref")?;
+            let shares = read_u32_be(&payload[18..22], "X.shares")?;
+            Ok(ItchMessage::OrderCancel {
+                timestamp,
+                order_ref,
+                shares,
+            })
         }
+        'D' => {
+            let timestamp = read_u48_be(&payload[4..10], "D.timestamp")?;
+            let order_ref = read_u64_be(&payload[10..18], "D.order_ref")?;
+            Ok(ItchMessage::OrderDelete {
+                timestamp,
+                order_ref,
+            })
+        }
+        'U' => {
+            let timestamp = read_u48_be(&payload[4..10], "U.timestamp")?;
+            let old_order_ref = read_u64_be(&payload[10..18], "U.old_order_ref")?;
+            let new_order_ref = read_u64_be(&payload[18..26], "U.new_order_ref")?;
+            let shares = read_u32_be(&payload[26..30], "U.shares")?;
+            let price = read_u32_be(&payload[30..34], "U.price")?;
+            Ok(ItchMessage::OrderReplace {
+                timestamp,
+                old_order_ref,
+                new_order_ref,
+                shares,
+                price,
+            })
+        }
+        'P' => {
+            let timestamp = read_u48_be(&payload[4..10], "P.timestamp")?;
+            let side = match payload[18] {
+                b'B' => Side::Buy,
+                _ => Side::Sell,
+            };
+            let shares = read_u32_be(&payload[19..23], "P.shares")?;
+            let stock = String::from_utf8_lossy(&payload[23..31]).trim().to_string();
+            let price = read_u32_be(&payload[31..35], "P.price")?;
+            let match_number = read_u64_be(&payload[35..43], "P.match_number")?;
+            Ok(ItchMessage::Trade {
+                timestamp,
+                side,
+                shares,
+                stock,
+                price,
+                match_number,
+            })
+        }
+        'R' => {
+            let locate = read_u16_be(&payload[0..2], "R.locate")?;
+            let stock = String::from_utf8_lossy(&payload[2..10]).trim().to_string();
+            stock_locates.insert(locate, stock.clone());
+            Ok(ItchMessage::StockDirectory { stock, locate })
+        }
+        _ => Ok(ItchMessage::Other(msg_type)),
     }
 }
 
@@ -355,6 +437,107 @@ pub fn itch_to_event(msg: ItchMessage) -> Option<(String, Event)> {
     }
 }
 
+/// Read buffer size for [`parse_reader_into`].
+const STREAM_BUF_SIZE: usize = 64 * 1024;
+
+/// Bytes of input per reserved output slot in [`parse_events_into`].
+///
+/// One framed Add Order is 38 bytes and a Delete 21; real feeds also
+/// interleave non-book messages, so this lands near the true count
+/// without the 4x over-allocation a minimum-frame estimate would cost.
+const EST_BYTES_PER_EVENT: usize = 32;
+
+/// Parse an in-memory ITCH stream into book-modifying events.
+///
+/// Drains an [`ItchSliceParser`] over `buf` and keeps the messages
+/// that [`itch_to_event`] maps to a nanobook [`Event`]. Stops at the
+/// first malformed frame and returns its error.
+pub fn parse_events(buf: &[u8]) -> Result<Vec<(String, Event)>> {
+    let mut events = Vec::new();
+    parse_events_into(buf, &mut events)?;
+    Ok(events)
+}
+
+/// Like [`parse_events`], but appends to `out` and returns the number of
+/// events added.
+///
+/// Lets a caller replaying many files reuse one allocation. Capacity is
+/// reserved up front from `buf.len()`. On error `out` is truncated back
+/// to its original length.
+pub fn parse_events_into(buf: &[u8], out: &mut Vec<(String, Event)>) -> Result<usize> {
+    out.reserve(buf.len() / EST_BYTES_PER_EVENT);
+    let start = out.len();
+    let mut parser = ItchSliceParser::new(buf);
+    let result = drain_into(|| parser.next_message(), out);
+    finish_into(result, out, start)
+}
+
+/// Parse ITCH frames from any reader, e.g. a pipe or decompressor.
+///
+/// Reads through a 64 KiB buffer and decodes into one reused message
+/// scratch, so memory use is bounded by the output regardless of input
+/// size. Appends to `out` and returns the number of events added; on
+/// error `out` is truncated back to its original length.
+pub fn parse_reader_into<R: Read>(reader: R, out: &mut Vec<(String, Event)>) -> Result<usize> {
+    let start = out.len();
+    let mut parser = ItchParser::new(BufReader::with_capacity(STREAM_BUF_SIZE, reader));
+    let result = drain_into(|| parser.next_message(), out);
+    finish_into(result, out, start)
+}
+
+/// Parse an ITCH file into book-modifying events.
+///
+/// Regular files are memory-mapped and decoded in place with
+/// [`parse_events`], so no userspace copy of the file is made. Pipes,
+/// FIFOs, and other non-regular files are streamed with
+/// [`parse_reader_into`].
+pub fn parse_file(path: &Path) -> Result<Vec<(String, Event)>> {
+    let mut events = Vec::new();
+    parse_file_into(path, &mut events)?;
+    Ok(events)
+}
+
+/// Like [`parse_file`], but appends to `out` and returns the number of
+/// events added. On error `out` is truncated back to its original length.
+pub fn parse_file_into(path: &Path, out: &mut Vec<(String, Event)>) -> Result<usize> {
+    let file = std::fs::File::open(path)?;
+    let metadata = file.metadata()?;
+    if !metadata.is_file() {
+        return parse_reader_into(file, out);
+    }
+    if metadata.len() == 0 {
+        return Ok(0);
+    }
+    // SAFETY: the map is read-only and dropped before this function
+    // returns. Truncating the file underneath it while we parse is a
+    // caller contract violation (same as for any mmap reader); the
+    // parser itself never reads past `mmap.len()`.
+    let mmap = unsafe { memmap2::Mmap::map(&file)? };
+    parse_events_into(&mmap, out)
+}
+
+fn drain_into(
+    mut next: impl FnMut() -> Result<Option<ItchMessage>>,
+    out: &mut Vec<(String, Event)>,
+) -> Result<()> {
+    while let Some(msg) = next()? {
+        if let Some(event) = itch_to_event(msg) {
+            out.push(event);
+        }
+    }
+    Ok(())
+}
+
+fn finish_into(result: Result<()>, out: &mut Vec<(String, Event)>, start: usize) -> Result<usize> {
+    match result {
+        Ok(()) => Ok(out.len() - start),
+        Err(e) => {
+            out.truncate(start);
+            Err(e)
+        }
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -455,6 +638,159 @@ mod tests {
         assert_eq!(msg, ItchMessage::Other('Z'));
     }
 
+    // ------------------------------------------------------------------
+    // Slice parser: same framing contract as the streaming parser
+    // ------------------------------------------------------------------
+
+    /// Framed 'D' (OrderDelete) message for `order_ref`.
+    fn delete_frame(order_ref: u64) -> Vec<u8> {
+        let mut frame = vec![0x00, 19, b'D'];
+        frame.extend_from_slice(&[0u8; 10]); // locate, tracking, timestamp
+        frame.extend_from_slice(&order_ref.to_be_bytes());
+        frame
+    }
+
+    #[test]
+    fn slice_parser_matches_stream_parser() {
+        let mut bytes = delete_frame(7);
+        bytes.extend_from_slice(&[0x00, 0x01, b'Z']);
+        bytes.extend_from_slice(&delete_frame(9));
+
+        let mut stream = ItchParser::new(&bytes[..]);
+        let mut slice = ItchSliceParser::new(&bytes);
+        for _ in 0..4 {
+            assert_eq!(
+                slice.next_message().unwrap(),
+                stream.next_message().unwrap()
+            );
+        }
+    }
+
+    #[test]
+    fn slice_parser_truncated_frame_returns_err() {
+        let bytes: [u8; 7] = [0x00, 0x64, 0xAA, 0xBB, 0xCC, 0xDD, 0xEE];
+        let mut parser = ItchSliceParser::new(&bytes);
+        let err = parser.next_message().unwrap_err();
+        assert_eq!(err.kind(), ErrorKind::UnexpectedEof);
+    }
+
+    #[test]
+    fn slice_parser_zero_length_prefix_returns_err() {
+        let mut parser = ItchSliceParser::new(&[0x00, 0x00]);
+        let err = parser.next_message().unwrap_err();
+        assert_eq!(err.kind(), ErrorKind::InvalidData);
+    }
+
+    #[test]
+    fn parse_events_keeps_book_events_only() {
+        let mut bytes = delete_frame(3);
+        bytes.extend_from_slice(&[0x00, 0x01, b'Z']);
+        let events = parse_events(&bytes).unwrap();
+        assert_eq!(events.len(), 1);
+        assert_eq!(
+            events[0].1,
+            Event::Cancel {
+                order_id: OrderId(3)
+            }
+        );
+    }
+
+    #[test]
+    fn parse_file_reads_mapped_bytes() {
+        let path = std::env::temp_dir().join(format!(
+            "nanobook-itch-{}-parse-file.bin",
+            std::process::id()
+        ));
+        std::fs::write(&path, delete_frame(5)).unwrap();
+        let events = parse_file(&path);
+        std::fs::remove_file(&path).unwrap();
+        assert_eq!(events.unwrap().len(), 1);
+    }
+
+    #[test]
+    fn parse_file_empty_is_ok() {
+        let path =
+            std::env::temp_dir().join(format!("nanobook-itch-{}-empty.bin", std::process::id()));
+        std::fs::write(&path, []).unwrap();
+        let events = parse_file(&path);
+        std::fs::remove_file(&path).unwrap();
+        assert!(events.unwrap().is_empty());
+    }
+
+    #[test]
+    fn min_payload_table_matches_decoder() {
+        for msg_type in *b"AFECXDUPR" {
+            let min = MIN_PAYLOAD[msg_type as usize] as usize;
+            assert!(min > 0, "{}", msg_type as char);
+
+            let mut body = vec![msg_type];
+            body.resize(1 + min, 0);
+            let mut locates = HashMap::new();
+            assert!(
+                decode_message(&body, &mut locates).is_ok(),
+                "{} at minimum length",
+                msg_type as char
+            );
+
+            body.pop();
+            let err = decode_message(&body, &mut locates).unwrap_err();
+            assert!(err.to_string().contains("too short"), "{err}");
+        }
+        assert_eq!(
+            decode_message(b"Z", &mut HashMap::new()).unwrap(),
+            ItchMessage::Other('Z')
+        );
+    }
+
+    #[test]
+    fn parse_events_into_appends_and_counts() {
+        let mut out = parse_events(&delete_frame(1)).unwrap();
+        let mut bytes = delete_frame(2);
+        bytes.extend_from_slice(&delete_frame(3));
+        assert_eq!(parse_events_into(&bytes, &mut out).unwrap(), 2);
+        assert_eq!(out.len(), 3);
+        assert_eq!(
+            out[2].1,
+            Event::Cancel {
+                order_id: OrderId(3)
+            }
+        );
+    }
+
+    #[test]
+    fn parse_events_into_rolls_back_on_error() {
+        let mut out = parse_events(&delete_frame(1)).unwrap();
+        let mut bytes = delete_frame(2);
+        bytes.extend_from_slice(&[0x00, 0x00]);
+        assert!(parse_events_into(&bytes, &mut out).is_err());
+        assert_eq!(out.len(), 1);
+    }
+
+    #[test]
+    fn parse_reader_into_matches_slice_parse() {
+        let mut bytes = Vec::new();
+        for order_ref in 0..5_000 {
+            bytes.extend_from_slice(&delete_frame(order_ref));
+            bytes.extend_from_slice(&[0x00, 0x01, b'Z']);
+        }
+        // Frames straddle the 64 KiB read-buffer boundary.
+        assert!(bytes.len() > STREAM_BUF_SIZE);
+
+        let mut streamed = Vec::new();
+        assert_eq!(parse_reader_into(&bytes[..], &mut streamed).unwrap(), 5_000);
+        assert_eq!(streamed, parse_events(&bytes).unwrap());
+    }
+
+    #[test]
+    fn parse_reader_into_rolls_back_on_truncation() {
+        let mut bytes = delete_frame(1);
+        bytes.extend_from_slice(&delete_frame(2)[..10]);
+        let mut out = Vec::new();
+        let err = parse_reader_into(&bytes[..], &mut out).unwrap_err();
+        assert_eq!(err.kind(), ErrorKind::UnexpectedEof);
+        assert!(out.is_empty());
+    }
+
     // ------------------------------------------------------------------
     // Property: arbitrary bytes in → never panic out
     // ------------------------------------------------------------------
@@ -481,5 +817,27 @@ mod tests {
                 }
             }
         }
+
+        /// The slice parser yields exactly what the streaming parser
+        /// yields on the same bytes, up to the first error.
+        #[test]
+        fn slice_parser_agrees_with_stream_parser(
+            bytes in prop::collection::vec(any::<u8>(), 0..4096),
+        ) {
+            let mut stream = ItchParser::new(bytes.as_slice());
+            let mut slice = ItchSliceParser::new(&bytes);
+            for _ in 0..32 {
+                match (stream.next_message(), slice.next_message()) {
+                    (Ok(a), Ok(b)) => {
+                        prop_assert_eq!(&a, &b);
+                        if a.is_none() {
+                            break;
+                        }
+                    }
+                    (Err(_), Err(_)) => break,
+                    (a, b) => prop_assert!(false, "diverged: {:?} vs {:?}", a, b),
+                }
+            }
+        }
     }
 }
@@ -2,6 +2,11 @@
 //!
 //! The Level stores only `OrderId`s, not full `Order` objects.
 //! Orders themselves live in a central `HashMap` for O(1) lookup.
+//!
+//! Each queued order has a *position*: an absolute sequence number that is
+//! handed out by [`Level::next_position`] and stays valid while orders are
+//! popped from the front. Only [`Level::compact`] moves live orders; the
+//! owning `OrderBook` renumbers them from [`Level::positions`] afterwards.
 
 use std::collections::VecDeque;
 
@@ -14,13 +19,15 @@ use crate::{OrderId, Price, Quantity};
 #[derive(Clone, Debug)]
 pub struct Level {
     /// The price for all orders in this level
-    price: Price,
+    pub(crate) price: Price,
     /// Order IDs in FIFO order
     pub(crate) orders: VecDeque<OrderId>,
     /// Sum of remaining quantities (cached for O(1) access)
     total_quantity: Quantity,
     /// Number of tombstones (cancelled orders still in the queue)
     tombstone_count: usize,
+    /// Position of `orders[0]` (entries popped from the front so far)
+    head: usize,
 }
 
 impl Level {
@@ -31,6 +38,7 @@ impl Level {
             orders: VecDeque::new(),
             total_quantity: 0,
             tombstone_count: 0,
+            head: 0,
         }
     }
 
@@ -75,6 +83,19 @@ impl Level {
         self.orders.len()
     }
 
+    /// Position the next `push_back` will occupy.
+    #[inline]
+    pub fn next_position(&self) -> usize {
+        self.head + self.orders.len()
+    }
+
+    /// Returns `(position, order_id)` for every active order in FIFO order.
+    pub fn positions(&self) -> impl Iterator<Item = (usize, OrderId)> + '_ {
+        (self.head..)
+            .zip(self.orders.iter().copied())
+            .filter(|&(_, id)| id.0 != 0)
+    }
+
     /// Returns the OrderId at the front of the queue (next to fill).
     /// Skips tombstones.
     pub fn front(&mut self) -> Option<OrderId> {
@@ -83,6 +104,7 @@ impl Level {
                 // It's a tombstone
                 self.orders.pop_front();
                 self.tombstone_count -= 1;
+                self.head += 1;
             } else {
                 return Some(id);
             }
@@ -107,6 +129,7 @@ impl Level {
     /// Returns `None` if the level is empty.
     pub fn pop_front(&mut self, quantity: Quantity) -> Option<OrderId> {
         while let Some(id) = self.orders.pop_front() {
+            self.head += 1;
             if id.0 == 0 {
                 self.tombstone_count -= 1;
                 continue;
@@ -119,28 +142,35 @@ impl Level {
 
     /// Mark an order as a tombstone (O(1) cancellation).
     ///
-    /// The caller provides the index into the VecDeque (tracked in OrderBook's
-    /// HashMap). The order's quantity is subtracted from the level total.
+    /// The caller provides the order's position (from
+    /// [`next_position`](Self::next_position) at insert time, tracked in
+    /// OrderBook's HashMap). The order's quantity is subtracted from the
+    /// level total. Positions already popped from the front are ignored.
     pub fn mark_tombstone(&mut self, index: usize, quantity: Quantity) {
-        if let Some(id_ref) = self.orders.get_mut(index) {
-            if id_ref.0 != 0 {
-                id_ref.0 = 0; // Set to tombstone ID
-                self.total_quantity = self.total_quantity.saturating_sub(quantity);
-                self.tombstone_count += 1;
-            }
+        let Some(slot) = index.checked_sub(self.head) else {
+            return;
+        };
+        if let Some(id_ref) = self.orders.get_mut(slot)
+            && id_ref.0 != 0
+        {
+            id_ref.0 = 0; // Set to tombstone ID
+            self.total_quantity = self.total_quantity.saturating_sub(quantity);
+            self.tombstone_count += 1;
         }
     }
 
     /// Remove a specific order from anywhere in the queue (for cancellation).
     ///
     /// Returns `true` if the order was found and removed, `false` otherwise.
-    /// The provided quantity is subtracted from the level's total.
+    /// The provided quantity is subtracted from the level's total. The slot
+    /// becomes a tombstone so the positions of later orders do not shift.
     ///
     /// Note: This is O(n) where n is the number of orders at this price level.
     /// For O(1) cancel, we now use `mark_tombstone` called from OrderBook.
     pub fn remove(&mut self, order_id: OrderId, quantity: Quantity) -> bool {
-        if let Some(pos) = self.orders.iter().position(|&id| id == order_id) {
-            self.orders.remove(pos);
+        if let Some(id_ref) = self.orders.iter_mut().find(|id| **id == order_id) {
+            id_ref.0 = 0;
+            self.tombstone_count += 1;
             self.total_quantity = self.total_quantity.saturating_sub(quantity);
             true
         } else {
@@ -149,6 +179,9 @@ impl Level {
     }
 
     /// Remove all tombstones from the queue.
+    ///
+    /// Live orders move to lower positions; read the new ones back with
+    /// [`positions`](Self::positions).
     pub fn compact(&mut self) {
         if self.tombstone_count == 0 {
             return;
@@ -334,6 +367,41 @@ mod tests {
         assert_eq!(level.orders[0], OrderId(2));
     }
 
+    #[test]
+    fn positions_survive_front_pops() {
+        let mut level = Level::new(Price(100_00));
+        for id in 1..=3 {
+            assert_eq!(level.next_position(), id as usize - 1);
+            level.push_back(OrderId(id), 100);
+        }
+
+        assert_eq!(level.pop_front(100), Some(OrderId(1)));
+        // Order 2 was queued at position 1 and is now at physical index 0.
+        level.mark_tombstone(1, 100);
+        assert_eq!(level.iter().collect::<Vec<_>>(), vec![OrderId(3)]);
+        assert_eq!(level.total_quantity(), 100);
+
+        // Stale position of an already-popped order is a no-op.
+        level.mark_tombstone(0, 100);
+        assert_eq!(level.total_quantity(), 100);
+        assert_eq!(level.next_position(), 3);
+    }
+
+    #[test]
+    fn positions_after_compact() {
+        let mut level = Level::new(Price(100_00));
+        level.push_back(OrderId(1), 100);
+        level.push_back(OrderId(2), 100);
+        level.push_back(OrderId(3), 100);
+        level.pop_front(100);
+        level.mark_tombstone(1, 100);
+        level.compact();
+
+        assert_eq!(level.positions().collect::<Vec<_>>(), vec![(1, OrderId(3))]);
+        level.mark_tombstone(1, 100);
+        assert!(level.is_empty());
+    }
+
     #[test]
     fn front_skips_tombstones() {
         let mut level = Level::new(Price(100_00));
@@ -182,7 +182,7 @@ pub mod volatility;
 // Re-export public API
 pub use book::OrderBook;
 pub use error::ValidationError;
-pub use event::{ApplyResult, Event};
+pub use event::{ApplyResult, Event, EventColumns};
 pub use exchange::Exchange;
 pub use level::Level;
 pub use matching::{MatchResult, StpPolicy};
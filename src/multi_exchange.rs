@@ -23,6 +23,11 @@ use rustc_hash::FxHashMap;
 /// assert_eq!(multi.get(&aapl).unwrap().best_ask(), Some(Price(150_00)));
 /// assert_eq!(multi.get(&msft).unwrap().best_ask(), Some(Price(300_00)));
 /// ```
+///
+/// There is no internal lock. `MultiExchange` is `Send + Sync`, so any
+/// number of threads can read it through a shared reference at once, and
+/// the books are independent, so per-symbol writes parallelize through
+/// `par_for_each_mut` (with the `parallel` feature).
 #[derive(Clone, Debug, Default)]
 pub struct MultiExchange {
     exchanges: FxHashMap<Symbol, Exchange>,
@@ -64,6 +69,32 @@ impl MultiExchange {
         self.exchanges.is_empty()
     }
 
+    /// Iterator over `(symbol, exchange)` pairs.
+    pub fn iter(&self) -> impl Iterator<Item = (&Symbol, &Exchange)> {
+        self.exchanges.iter()
+    }
+
+    /// Iterator over `(symbol, exchange)` pairs with mutable books.
+    pub fn iter_mut(&mut self) -> impl Iterator<Item = (&Symbol, &mut Exchange)> {
+        self.exchanges.iter_mut()
+    }
+
+    /// Run `f` on every symbol's exchange, spread across the rayon pool.
+    ///
+    /// Each book is visited by exactly one thread, so `f` gets plain
+    /// `&mut Exchange` access with no locking.
+    #[cfg(feature = "parallel")]
+    pub fn par_for_each_mut<F>(&mut self, f: F)
+    where
+        F: Fn(&Symbol, &mut Exchange) + Send + Sync,
+    {
+        use rayon::prelude::*;
+
+        self.exchanges
+            .par_iter_mut()
+            .for_each(|(sym, ex)| f(sym, ex));
+    }
+
     /// Get the best bid and ask for all symbols.
     pub fn best_prices(&self) -> Vec<(Symbol, Option<Price>, Option<Price>)> {
         self.exchanges
@@ -132,6 +163,63 @@ mod tests {
         assert_eq!(multi.len(), 0);
     }
 
+    #[test]
+    fn shared_reads_across_threads() {
+        fn assert_send_sync<T: Send + Sync>() {}
+        assert_send_sync::<MultiExchange>();
+
+        let mut multi = MultiExchange::new();
+        for (i, sym) in [aapl(), msft()].iter().enumerate() {
+            multi.get_or_create(sym).submit_limit(
+                Side::Sell,
+                Price(100_00 * (i as i64 + 1)),
+                100,
+                TimeInForce::GTC,
+            );
+        }
+
+        let multi = &multi;
+        std::thread::scope(|s| {
+            let readers: Vec<_> = (0..4)
+                .map(|_| s.spawn(move || multi.best_prices().len()))
+                .collect();
+            for reader in readers {
+                assert_eq!(reader.join().unwrap(), 2);
+            }
+        });
+    }
+
+    #[test]
+    fn iter_mut_reaches_every_book() {
+        let mut multi = MultiExchange::new();
+        multi.get_or_create(&aapl());
+        multi.get_or_create(&msft());
+        for (_, ex) in multi.iter_mut() {
+            ex.submit_limit(Side::Buy, Price(99_00), 10, TimeInForce::GTC);
+        }
+        assert!(
+            multi
+                .iter()
+                .all(|(_, ex)| ex.best_bid() == Some(Price(99_00)))
+        );
+    }
+
+    #[cfg(feature = "parallel")]
+    #[test]
+    fn par_for_each_mut_reaches_every_book() {
+        let mut multi = MultiExchange::new();
+        multi.get_or_create(&aapl());
+        multi.get_or_create(&msft());
+        multi.par_for_each_mut(|_, ex| {
+            ex.submit_limit(Side::Buy, Price(99_00), 10, TimeInForce::GTC);
+        });
+        assert!(
+            multi
+                .iter()
+                .all(|(_, ex)| ex.best_bid() == Some(Price(99_00)))
+        );
+    }
+
     #[test]
     fn independent_books() {
         let mut multi = MultiExchange::new();
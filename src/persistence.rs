@@ -28,16 +28,35 @@ use crate::event::Event;
 pub fn save_events(events: &[Event], path: &Path) -> io::Result<()> {
     let file = std::fs::File::create(path)?;
     let mut writer = io::BufWriter::new(file);
+    write_events(events, &mut writer)?;
+    writer.flush()
+}
 
+/// Write events to `writer` in JSON Lines format.
+///
+/// Each event is serialized straight into the writer, so no per-event
+/// `String` is allocated. Writing into a `Vec<u8>` gives the same bytes
+/// as a file from [`save_events`].
+pub fn write_events<W: Write>(events: &[Event], mut writer: W) -> io::Result<()> {
     for event in events {
-        let json = serde_json::to_string(event).map_err(io::Error::other)?;
-        writeln!(writer, "{}", json)?;
+        serde_json::to_writer(&mut writer, event).map_err(io::Error::other)?;
+        writer.write_all(b"\n")?;
     }
-
-    writer.flush()?;
     Ok(())
 }
 
+/// Parse events from an in-memory JSON Lines buffer.
+///
+/// Counterpart of [`write_events`]. Decodes the buffer in one pass
+/// without splitting it into per-line strings; any whitespace between
+/// events is accepted.
+pub fn events_from_slice(data: &[u8]) -> io::Result<Vec<Event>> {
+    serde_json::Deserializer::from_slice(data)
+        .into_iter::<Event>()
+        .collect::<Result<_, _>>()
+        .map_err(|e| io::Error::new(io::ErrorKind::InvalidData, e))
+}
+
 /// Load events from a JSON Lines file.
 ///
 /// Each line is parsed as one JSON event object.
@@ -142,6 +161,29 @@ mod tests {
         let _ = std::fs::remove_file(&path);
     }
 
+    #[test]
+    fn in_memory_round_trip_matches_file_format() {
+        let path = test_path("in_memory");
+        let events = vec![
+            Event::submit_limit(Side::Sell, Price(100_00), 100, TimeInForce::GTC),
+            Event::submit_market(Side::Buy, 50),
+            Event::cancel(crate::OrderId(1)),
+        ];
+
+        let mut buf = Vec::new();
+        write_events(&events, &mut buf).unwrap();
+        assert_eq!(events_from_slice(&buf).unwrap(), events);
+
+        save_events(&events, &path).unwrap();
+        let file_bytes = std::fs::read(&path).unwrap();
+        let _ = std::fs::remove_file(&path);
+        assert_eq!(file_bytes, buf);
+
+        assert!(events_from_slice(b"").unwrap().is_empty());
+        let err = events_from_slice(&buf[..buf.len() - 5]).unwrap_err();
+        assert_eq!(err.kind(), io::ErrorKind::InvalidData);
+    }
+
     #[test]
     fn load_nonexistent_file() {
         let result = Exchange::load(Path::new("nonexistent_file.jsonl"));
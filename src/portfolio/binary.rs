@@ -0,0 +1,273 @@
+//! Compact binary encoding for [`Portfolio`] snapshots.
+//!
+//! Layout (all integers little-endian):
+//!
+//! ```text
+//! magic "NBPF" | version u8
+//! cash i64 | prev_equity i64
+//! commission_bps u32 | slippage_bps u32 | min_trade_fee i64
+//! n_positions u64 | n × (symbol_len u8, symbol bytes,
+//!                        quantity i64, avg_entry_price i64,
+//!                        realized_pnl i64, total_cost i64)
+//! n_returns u64 | n × f64
+//! n_equity u64 | n × i64
+//! ```
+//!
+//! Positions are written in symbol order so identical portfolios encode to
+//! identical bytes.
+
+use std::io;
+
+use super::{CostModel, Portfolio, Position};
+use crate::types::Symbol;
+use rustc_hash::FxHashMap;
+
+const MAGIC: &[u8; 4] = b"NBPF";
+const VERSION: u8 = 1;
+
+impl Portfolio {
+    /// Encode the portfolio into the binary snapshot format.
+    pub fn to_bytes(&self) -> Vec<u8> {
+        let mut positions: Vec<&Position> = self.positions.values().collect();
+        positions.sort_by_key(|p| p.symbol);
+
+        let mut out = Vec::with_capacity(
+            61 + positions.len() * 41 + (self.returns.len() + self.equity_curve.len()) * 8,
+        );
+        out.extend_from_slice(MAGIC);
+        out.push(VERSION);
+        out.extend_from_slice(&self.cash.to_le_bytes());
+        out.extend_from_slice(&self.prev_equity.to_le_bytes());
+        out.extend_from_slice(&self.cost_model.commission_bps.to_le_bytes());
+        out.extend_from_slice(&self.cost_model.slippage_bps.to_le_bytes());
+        out.extend_from_slice(&self.cost_model.min_trade_fee.to_le_bytes());
+
+        out.extend_from_slice(&(positions.len() as u64).to_le_bytes());
+        for pos in positions {
+            let sym = pos.symbol.as_str().as_bytes();
+            out.push(sym.len() as u8);
+            out.extend_from_slice(sym);
+            for field in [
+                pos.quantity,
+                pos.avg_entry_price,
+                pos.realized_pnl,
+                pos.total_cost,
+            ] {
+                out.extend_from_slice(&field.to_le_bytes());
+            }
+        }
+
+        out.extend_from_slice(&(self.returns.len() as u64).to_le_bytes());
+        for r in &self.returns {
+            out.extend_from_slice(&r.to_le_bytes());
+        }
+        out.extend_from_slice(&(self.equity_curve.len() as u64).to_le_bytes());
+        for e in &self.equity_curve {
+            out.extend_from_slice(&e.to_le_bytes());
+        }
+        out
+    }
+
+    /// Decode a portfolio written by [`Portfolio::to_bytes`].
+    ///
+    /// Returns `InvalidData` for a bad header, symbol, or trailing bytes and
+    /// `UnexpectedEof` if the buffer is truncated.
+    pub fn from_bytes(buf: &[u8]) -> io::Result<Self> {
+        let mut r = Reader { buf, pos: 0 };
+        if r.take(4)? != MAGIC {
+            return Err(invalid("not a nanobook portfolio snapshot"));
+        }
+        let version = r.take(1)?[0];
+        if version != VERSION {
+            return Err(invalid(format!(
+                "unsupported portfolio snapshot version {version}"
+            )));
+        }
+
+        let cash = r.i64()?;
+        let prev_equity = r.i64()?;
+        let cost_model = CostModel {
+            commission_bps: r.u32()?,
+            slippage_bps: r.u32()?,
+            min_trade_fee: r.i64()?,
+        };
+
+        let n = r.count(33)?;
+        let mut positions = FxHashMap::with_capacity_and_hasher(n, Default::default());
+        for _ in 0..n {
+            let len = r.take(1)?[0] as usize;
+            let symbol = std::str::from_utf8(r.take(len)?)
+                .ok()
+                .and_then(Symbol::try_new)
+                .ok_or_else(|| invalid("invalid position symbol"))?;
+            let pos = Position {
+                symbol,
+                quantity: r.i64()?,
+                avg_entry_price: r.i64()?,
+                realized_pnl: r.i64()?,
+                total_cost: r.i64()?,
+            };
+            positions.insert(symbol, pos);
+        }
+
+        let n = r.count(8)?;
+        let returns = (0..n)
+            .map(|_| r.take(8).map(|b| f64::from_le_bytes(le8(b))))
+            .collect::<io::Result<Vec<f64>>>()?;
+        let n = r.count(8)?;
+        let equity_curve = (0..n).map(|_| r.i64()).collect::<io::Result<Vec<i64>>>()?;
+
+        if r.pos != buf.len() {
+            return Err(invalid("trailing bytes after portfolio snapshot"));
+        }
+
+        Ok(Self {
+            cash,
+            positions,
+            cost_model,
+            returns,
+            equity_curve,
+            prev_equity,
+        })
+    }
+}
+
+struct Reader<'a> {
+    buf: &'a [u8],
+    pos: usize,
+}
+
+impl<'a> Reader<'a> {
+    fn take(&mut self, n: usize) -> io::Result<&'a [u8]> {
+        let end = self
+            .pos
+            .checked_add(n)
+            .filter(|&end| end <= self.buf.len())
+            .ok_or_else(|| {
+                io::Error::new(io::ErrorKind::UnexpectedEof, "portfolio snapshot truncated")
+            })?;
+        let bytes = &self.buf[self.pos..end];
+        self.pos = end;
+        Ok(bytes)
+    }
+
+    fn u32(&mut self) -> io::Result<u32> {
+        let b = self.take(4)?;
+        Ok(u32::from_le_bytes([b[0], b[1], b[2], b[3]]))
+    }
+
+    fn i64(&mut self) -> io::Result<i64> {
+        self.take(8).map(|b| i64::from_le_bytes(le8(b)))
+    }
+
+    /// Read an element count, rejecting counts that cannot fit in the
+    /// remaining bytes (so a corrupt header cannot force a huge allocation).
+    fn count(&mut self, min_elem_size: usize) -> io::Result<usize> {
+        let n = self.take(8).map(|b| u64::from_le_bytes(le8(b)))?;
+        let remaining = (self.buf.len() - self.pos) as u64;
+        if n.saturating_mul(min_elem_size as u64) > remaining {
+            return Err(io::Error::new(
+                io::ErrorKind::UnexpectedEof,
+                "portfolio snapshot truncated",
+            ));
+        }
+        Ok(n as usize)
+    }
+}
+
+fn le8(b: &[u8]) -> [u8; 8] {
+    b.try_into().expect("take(8) returns 8 bytes")
+}
+
+fn invalid(msg: impl Into<String>) -> io::Error {
+    io::Error::new(io::ErrorKind::InvalidData, msg.into())
+}
+
+#[cfg(test)]
+#[allow(clippy::inconsistent_digit_grouping)]
+mod tests {
+    use super::*;
+
+    fn sample() -> Portfolio {
+        let mut portfolio = Portfolio::new(
+            1_000_000_00,
+            CostModel {
+                commission_bps: 10,
+                slippage_bps: 5,
+                min_trade_fee: 1_00,
+            },
+        );
+        let aapl = Symbol::new("AAPL");
+        let msft = Symbol::new("MSFT");
+        let prices = [(aapl, 150_00), (msft, 300_00)];
+        portfolio.rebalance_simple(&[(aapl, 0.6), (msft, 0.3)], &prices);
+        portfolio.record_return(&prices);
+        portfolio.record_return(&[(aapl, 155_00), (msft, 290_00)]);
+        portfolio
+    }
+
+    #[test]
+    fn round_trip_preserves_state() {
+        let portfolio = sample();
+        let loaded = Portfolio::from_bytes(&portfolio.to_bytes()).unwrap();
+
+        assert_eq!(loaded.cash(), portfolio.cash());
+        assert_eq!(loaded.returns(), portfolio.returns());
+        assert_eq!(loaded.equity_curve(), portfolio.equity_curve());
+        assert_eq!(loaded.prev_equity, portfolio.prev_equity);
+        assert_eq!(
+            loaded.cost_model().commission_bps,
+            portfolio.cost_model().commission_bps
+        );
+        for (sym, pos) in &portfolio.positions {
+            let other = loaded.position(sym).unwrap();
+            assert_eq!(other.quantity, pos.quantity);
+            assert_eq!(other.avg_entry_price, pos.avg_entry_price);
+            assert_eq!(other.realized_pnl, pos.realized_pnl);
+            assert_eq!(other.total_cost, pos.total_cost);
+        }
+        assert_eq!(loaded.to_bytes(), portfolio.to_bytes());
+    }
+
+    #[test]
+    fn empty_portfolio_round_trips() {
+        let portfolio = Portfolio::new(0, CostModel::zero());
+        let loaded = Portfolio::from_bytes(&portfolio.to_bytes()).unwrap();
+        assert_eq!(loaded.cash(), 0);
+        assert!(loaded.returns().is_empty());
+    }
+
+    #[test]
+    fn rejects_bad_magic_and_version() {
+        let mut bytes = sample().to_bytes();
+        bytes[4] = 99;
+        let err = Portfolio::from_bytes(&bytes).unwrap_err();
+        assert_eq!(err.kind(), io::ErrorKind::InvalidData);
+
+        let err = Portfolio::from_bytes(b"JSON{...}").unwrap_err();
+        assert_eq!(err.kind(), io::ErrorKind::InvalidData);
+    }
+
+    #[test]
+    fn rejects_truncated_and_trailing_bytes() {
+        let bytes = sample().to_bytes();
+        for cut in [0, 5, 20, bytes.len() - 1] {
+            let err = Portfolio::from_bytes(&bytes[..cut]).unwrap_err();
+            assert_eq!(err.kind(), io::ErrorKind::UnexpectedEof, "cut at {cut}");
+        }
+
+        let mut extra = bytes.clone();
+        extra.push(0);
+        let err = Portfolio::from_bytes(&extra).unwrap_err();
+        assert_eq!(err.kind(), io::ErrorKind::InvalidData);
+    }
+
+    #[test]
+    fn huge_count_is_rejected_without_allocating() {
+        let mut bytes = Portfolio::new(0, CostModel::zero()).to_bytes();
+        // Overwrite n_positions (offset 4 + 1 + 8 + 8 + 4 + 4 + 8 = 37).
+        bytes[37..45].copy_from_slice(&u64::MAX.to_le_bytes());
+        let err = Portfolio::from_bytes(&bytes).unwrap_err();
+        assert_eq!(err.kind(), io::ErrorKind::UnexpectedEof);
+    }
+}
@@ -88,8 +88,26 @@ pub fn compute_metrics(returns: &[f64], periods_per_year: f64, risk_free: f64) -
 
     let n = returns.len();
 
+    // One pass for the running aggregates: compounded growth, sum, and the
+    // win/loss split. Accumulation order matches the per-metric folds.
+    let mut growth = 1.0_f64;
+    let mut sum = 0.0_f64;
+    let (mut winning_periods, mut losing_periods) = (0_usize, 0_usize);
+    let (mut sum_positive, mut sum_negative) = (0.0_f64, 0.0_f64);
+    for &r in returns {
+        growth *= 1.0 + r;
+        sum += r;
+        if r > 0.0 {
+            winning_periods += 1;
+            sum_positive += r;
+        } else if r < 0.0 {
+            losing_periods += 1;
+            sum_negative += r;
+        }
+    }
+
     // Total return: product of (1 + r_i) - 1
-    let total_return = returns.iter().fold(1.0_f64, |acc, &r| acc * (1.0 + r)) - 1.0;
+    let total_return = growth - 1.0;
 
     // CAGR: (1 + total_return)^(periods_per_year / n) - 1
     let years = n as f64 / periods_per_year;
@@ -102,7 +120,7 @@ pub fn compute_metrics(returns: &[f64], periods_per_year: f64, risk_free: f64) -
     };
 
     // Mean return
-    let mean = returns.iter().sum::<f64>() / n as f64;
+    let mean = sum / n as f64;
 
     // Volatility (sample std dev, annualized)
     let variance = if n > 1 {
@@ -138,10 +156,6 @@ pub fn compute_metrics(returns: &[f64], periods_per_year: f64, risk_free: f64) -
         0.0
     };
 
-    // Win/loss counts
-    let winning_periods = returns.iter().filter(|&&r| r > 0.0).count();
-    let losing_periods = returns.iter().filter(|&&r| r < 0.0).count();
-
     // --- v0.8 extended metrics ---
 
     // CVaR (95%): mean of the worst 5% of returns. v0.10 default is
@@ -154,8 +168,6 @@ pub fn compute_metrics(returns: &[f64], periods_per_year: f64, risk_free: f64) -
     let win_rate = winning_periods as f64 / n as f64;
 
     // Profit factor: sum(positive) / |sum(negative)|
-    let sum_positive: f64 = returns.iter().filter(|&&r| r > 0.0).sum();
-    let sum_negative: f64 = returns.iter().filter(|&&r| r < 0.0).sum();
     // Exact zero check is appropriate: sum_negative is exactly 0.0 when there are no negative returns
     let profit_factor = if sum_negative != 0.0 {
         sum_positive / sum_negative.abs()
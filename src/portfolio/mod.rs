@@ -25,6 +25,7 @@
 //! assert!(snapshot.equity > 0);
 //! ```
 
+mod binary;
 pub mod cost_model;
 pub mod metrics;
 pub mod position;
@@ -124,6 +125,17 @@ impl Portfolio {
         }
     }
 
+    /// Create a portfolio with room for `periods` recorded returns.
+    ///
+    /// Reserves the return series and equity curve up front so a backtest
+    /// of known length never reallocates them in [`record_return`](Self::record_return).
+    pub fn with_capacity(initial_cash: i64, cost_model: CostModel, periods: usize) -> Self {
+        let mut portfolio = Self::new(initial_cash, cost_model);
+        portfolio.returns.reserve_exact(periods);
+        portfolio.equity_curve.reserve_exact(periods);
+        portfolio
+    }
+
     // === Queries ===
 
     /// Current cash balance (cents).
@@ -245,6 +257,21 @@ impl Portfolio {
         }
     }
 
+    /// Rebalance via [`rebalance_simple`](Self::rebalance_simple) and return the
+    /// resulting [`snapshot`](Self::snapshot) at the same prices.
+    ///
+    /// Equivalent to calling the two separately, but `prices` is hashed once
+    /// and the post-trade snapshot is taken in a single pass over positions.
+    pub fn rebalance_and_snapshot(
+        &mut self,
+        targets: &[(Symbol, f64)],
+        prices: &[(Symbol, i64)],
+    ) -> PortfolioSnapshot {
+        let price_map: FxHashMap<Symbol, i64> = prices.iter().copied().collect();
+        self.rebalance_simple_from_price_map(targets, &price_map);
+        self.snapshot_from_price_map(&price_map)
+    }
+
     /// Close a single symbol position at the provided price.
     ///
     /// Returns `true` if a non-flat position existed and was closed.
@@ -380,7 +407,11 @@ impl Portfolio {
     }
 
     pub(crate) fn record_return_from_price_map(&mut self, price_map: &FxHashMap<Symbol, i64>) {
-        let equity = self.total_equity_from_price_map(price_map);
+        self.record_equity(self.total_equity_from_price_map(price_map));
+    }
+
+    /// Record a return from an equity figure the caller already computed.
+    pub(crate) fn record_equity(&mut self, equity: i64) {
         if self.prev_equity > 0 {
             let ret = (equity - self.prev_equity) as f64 / self.prev_equity as f64;
             self.returns.push(ret);
@@ -392,15 +423,42 @@ impl Portfolio {
     /// Take a snapshot of the portfolio state.
     pub fn snapshot(&self, prices: &[(Symbol, i64)]) -> PortfolioSnapshot {
         let price_map: FxHashMap<Symbol, i64> = prices.iter().copied().collect();
-        let equity = self.total_equity_from_price_map(&price_map);
-        let weights = self.current_weights_from_price_map(&price_map, equity);
-        let total_realized_pnl: i64 = self.positions.values().map(|p| p.realized_pnl).sum();
+        self.snapshot_from_price_map(&price_map)
+    }
+
+    /// Single pass over positions: market values, realized PnL, and the
+    /// open-position count are gathered together, then scaled into weights.
+    pub(crate) fn snapshot_from_price_map(
+        &self,
+        price_map: &FxHashMap<Symbol, i64>,
+    ) -> PortfolioSnapshot {
+        let mut equity = self.cash;
+        let mut total_realized_pnl = 0;
+        let mut weights = Vec::with_capacity(self.positions.len());
+        for (sym, pos) in &self.positions {
+            total_realized_pnl += pos.realized_pnl;
+            if pos.is_flat() {
+                continue;
+            }
+            let mv = pos.market_value(price_map.get(sym).copied().unwrap_or(0));
+            equity += mv;
+            weights.push((*sym, mv as f64));
+        }
+
+        let num_positions = weights.len();
+        if equity == 0 {
+            weights.clear();
+        } else {
+            for (_, w) in &mut weights {
+                *w /= equity as f64;
+            }
+        }
 
         PortfolioSnapshot {
             cash: self.cash,
             equity,
             weights,
-            num_positions: self.positions.values().filter(|p| !p.is_flat()).count(),
+            num_positions,
             total_realized_pnl,
         }
     }
@@ -421,6 +479,19 @@ impl Portfolio {
         serde_json::from_str(&json).map_err(std::io::Error::other)
     }
 
+    /// Save the portfolio to a compact binary file (see [`Portfolio::to_bytes`]).
+    ///
+    /// Faster to write and read than [`save_json`](Self::save_json) for large
+    /// return series; the file is not human-readable.
+    pub fn save_bin(&self, path: &std::path::Path) -> std::io::Result<()> {
+        std::fs::write(path, self.to_bytes())
+    }
+
+    /// Load a portfolio from a file written by [`save_bin`](Self::save_bin).
+    pub fn load_bin(path: &std::path::Path) -> std::io::Result<Self> {
+        Self::from_bytes(&std::fs::read(path)?)
+    }
+
     // === Internal ===
 
     pub(crate) fn total_equity_from_price_map(&self, price_map: &FxHashMap<Symbol, i64>) -> i64 {
@@ -603,6 +674,21 @@ mod tests {
         assert!(ret > 0.0);
     }
 
+    #[test]
+    fn with_capacity_reserves_series() {
+        let mut portfolio = Portfolio::with_capacity(100_00, CostModel::zero(), 64);
+        assert_eq!(portfolio.equity_curve(), &[100_00]);
+        let returns_ptr = portfolio.returns.as_ptr();
+        let curve_ptr = portfolio.equity_curve.as_ptr();
+        for _ in 0..64 {
+            portfolio.record_return(&[(aapl(), 10_00)]);
+        }
+        assert_eq!(portfolio.returns().len(), 64);
+        assert_eq!(portfolio.equity_curve().len(), 65);
+        assert_eq!(portfolio.returns.as_ptr(), returns_ptr);
+        assert_eq!(portfolio.equity_curve.as_ptr(), curve_ptr);
+    }
+
     #[test]
     fn snapshot() {
         let mut portfolio = Portfolio::new(1_000_000_00, CostModel::zero());
@@ -615,6 +701,43 @@ mod tests {
         assert!((snap.equity - 1_000_000_00).abs() < 300_00);
     }
 
+    #[test]
+    fn rebalance_and_snapshot_matches_separate_calls() {
+        let cost = CostModel {
+            commission_bps: 10,
+            slippage_bps: 5,
+            min_trade_fee: 1_00,
+        };
+        let mut fused = Portfolio::new(1_000_000_00, cost);
+        let mut separate = Portfolio::new(1_000_000_00, cost);
+
+        let bars = [
+            (
+                vec![(aapl(), 0.6), (msft(), 0.3)],
+                [(aapl(), 150_00), (msft(), 300_00)],
+            ),
+            (vec![(msft(), 0.8)], [(aapl(), 160_00), (msft(), 290_00)]),
+        ];
+        for (targets, prices) in &bars {
+            let a = fused.rebalance_and_snapshot(targets, prices);
+            separate.rebalance_simple(targets, prices);
+            let b = separate.snapshot(prices);
+
+            assert_eq!(a.cash, b.cash);
+            assert_eq!(a.equity, b.equity);
+            assert_eq!(a.num_positions, b.num_positions);
+            assert_eq!(a.total_realized_pnl, b.total_realized_pnl);
+            let mut wa = a.weights.clone();
+            let mut wb = b.weights.clone();
+            wa.sort_by_key(|(s, _)| *s);
+            wb.sort_by_key(|(s, _)| *s);
+            assert_eq!(wa, wb);
+            assert_eq!(a.equity, separate.total_equity(prices));
+        }
+        assert_eq!(fused.cash(), separate.cash());
+        assert_eq!(fused.position(&aapl()).unwrap().quantity, 0);
+    }
+
     #[test]
     fn current_weights() {
         let mut portfolio = Portfolio::new(1_000_000_00, CostModel::zero());
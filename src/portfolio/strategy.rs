@@ -79,7 +79,7 @@ pub fn run_backtest<S: Strategy>(
     periods_per_year: f64,
     risk_free: f64,
 ) -> BacktestResult {
-    let mut portfolio = Portfolio::new(initial_cash, cost_model);
+    let mut portfolio = Portfolio::with_capacity(initial_cash, cost_model, price_series.len());
 
     for (i, prices) in price_series.iter().enumerate() {
         let weights = strategy.compute_weights(i, prices, &portfolio);
@@ -1,9 +1,7 @@
 //! PriceLevels: One side of the order book (bids or asks).
 //!
-//! Maintains a sorted collection of price levels with cached best price
-//! for O(1) BBO (best bid/offer) queries.
-
-use std::collections::BTreeMap;
+//! Maintains a sorted collection of price levels with the best level at
+//! the tail for O(1) BBO (best bid/offer) queries.
 
 use crate::{Level, OrderId, Price, Quantity, Side};
 
@@ -12,14 +10,14 @@ use crate::{Level, OrderId, Price, Quantity, Side};
 /// - **Bids**: Sorted high → low, best = highest price
 /// - **Asks**: Sorted low → high, best = lowest price
 ///
-/// The `BTreeMap` provides O(log n) insert/remove with sorted iteration.
-/// Best price is cached for O(1) access.
+/// Levels live in a flat `Vec` ordered worst → best, so the best level is
+/// always the last element. Lookups are a binary search over contiguous
+/// memory, and the common mutations — adding, draining, or removing a
+/// level at or near the top of the book — touch only the tail.
 #[derive(Clone, Debug)]
 pub struct PriceLevels {
-    /// Price levels, sorted by price
-    levels: BTreeMap<Price, Level>,
-    /// Cached best price for O(1) access
-    best_price: Option<Price>,
+    /// Price levels, sorted worst → best
+    levels: Vec<Level>,
     /// Which side this represents (determines "best" direction)
     side: Side,
 }
@@ -28,8 +26,7 @@ impl PriceLevels {
     /// Create a new empty price levels collection for the given side.
     pub fn new(side: Side) -> Self {
         Self {
-            levels: BTreeMap::new(),
-            best_price: None,
+            levels: Vec::new(),
             side,
         }
     }
@@ -54,80 +51,73 @@ impl PriceLevels {
 
     /// Returns the best price (highest for bids, lowest for asks).
     ///
-    /// O(1) - cached value.
+    /// O(1) - the best level is the last element.
     #[inline]
     pub fn best_price(&self) -> Option<Price> {
-        self.best_price
+        self.levels.last().map(Level::price)
     }
 
     /// Returns a reference to the best level.
     ///
-    /// O(1) - uses cached best price.
+    /// O(1) - the best level is the last element.
     pub fn best_level(&self) -> Option<&Level> {
-        self.best_price.and_then(|p| self.levels.get(&p))
+        self.levels.last()
     }
 
     /// Returns a mutable reference to the best level.
     ///
-    /// O(1) - uses cached best price.
+    /// O(1) - the best level is the last element.
     pub fn best_level_mut(&mut self) -> Option<&mut Level> {
-        self.best_price.and_then(|p| self.levels.get_mut(&p))
+        self.levels.last_mut()
     }
 
     /// Returns a reference to the level at the given price, if it exists.
     pub fn get_level(&self, price: Price) -> Option<&Level> {
-        self.levels.get(&price)
+        self.find(price).ok().map(|i| &self.levels[i])
     }
 
     /// Returns a mutable reference to the level at the given price, if it exists.
     pub fn get_level_mut(&mut self, price: Price) -> Option<&mut Level> {
-        self.levels.get_mut(&price)
+        self.find(price).ok().map(|i| &mut self.levels[i])
     }
 
     /// Gets or creates a level at the given price.
-    ///
-    /// If the level is newly created, updates the best price cache if needed.
     pub fn get_or_create_level(&mut self, price: Price) -> &mut Level {
-        // Check if we need to update best price before borrowing levels
-        let is_new = !self.levels.contains_key(&price);
-
-        if is_new {
-            // Update best price cache before inserting
-            self.update_best_price_after_insert(price);
-            self.levels.insert(price, Level::new(price));
-        }
-
-        // Safe: we just inserted the level if it didn't exist
-        self.levels
-            .get_mut(&price)
-            .expect("level should exist after insertion")
+        let index = match self.find(price) {
+            Ok(index) => index,
+            Err(index) => {
+                self.levels.insert(index, Level::new(price));
+                index
+            }
+        };
+        &mut self.levels[index]
     }
 
     /// Add an order at the given price.
     ///
     /// Creates the level if it doesn't exist.
-    /// Returns the position index within the level.
+    /// Returns the order's position within the level (see [`Level::positions`]).
     pub fn insert_order(&mut self, price: Price, order_id: OrderId, quantity: Quantity) -> usize {
         let level = self.get_or_create_level(price);
-        // Actually, VecDeque index is just the length before push.
-        let actual_index = level.orders.len();
+        let position = level.next_position();
         level.push_back(order_id, quantity);
-        actual_index
+        position
     }
 
     /// Mark an order as a tombstone.
     pub fn mark_tombstone(&mut self, price: Price, index: usize, quantity: Quantity) {
-        if let Some(level) = self.levels.get_mut(&price) {
+        if let Ok(i) = self.find(price) {
+            let level = &mut self.levels[i];
             level.mark_tombstone(index, quantity);
             if level.is_empty() {
-                self.remove_level(price);
+                self.levels.remove(i);
             }
         }
     }
 
     /// Remove all tombstones from all levels.
     pub fn compact(&mut self) {
-        for level in self.levels.values_mut() {
+        for level in &mut self.levels {
             level.compact();
         }
     }
@@ -137,10 +127,11 @@ impl PriceLevels {
     /// Returns `true` if the order was found and removed.
     /// Removes the level entirely if it becomes empty.
     pub fn remove_order(&mut self, price: Price, order_id: OrderId, quantity: Quantity) -> bool {
-        if let Some(level) = self.levels.get_mut(&price) {
+        if let Ok(i) = self.find(price) {
+            let level = &mut self.levels[i];
             if level.remove(order_id, quantity) {
                 if level.is_empty() {
-                    self.remove_level(price);
+                    self.levels.remove(i);
                 }
                 return true;
             }
@@ -149,14 +140,9 @@ impl PriceLevels {
     }
 
     /// Remove a price level entirely.
-    ///
-    /// Updates the best price cache if the removed level was the best.
     pub fn remove_level(&mut self, price: Price) {
-        if self.levels.remove(&price).is_some() {
-            // Update best price if we removed it
-            if self.best_price == Some(price) {
-                self.recompute_best_price();
-            }
+        if let Ok(i) = self.find(price) {
+            self.levels.remove(i);
         }
     }
 
@@ -164,10 +150,7 @@ impl PriceLevels {
     ///
     /// Useful when a level is fully consumed during matching.
     pub fn pop_best_level(&mut self) -> Option<Level> {
-        let price = self.best_price?;
-        let level = self.levels.remove(&price);
-        self.recompute_best_price();
-        level
+        self.levels.pop()
     }
 
     /// Returns an iterator over levels from best to worst price.
@@ -175,18 +158,12 @@ impl PriceLevels {
     /// - Bids: highest to lowest
     /// - Asks: lowest to highest
     pub fn iter_best_to_worst(&self) -> impl Iterator<Item = (&Price, &Level)> {
-        BestToWorstIter {
-            inner: if self.side == Side::Buy {
-                IterDirection::Reverse(self.levels.iter().rev())
-            } else {
-                IterDirection::Forward(self.levels.iter())
-            },
-        }
+        self.levels.iter().rev().map(|level| (&level.price, level))
     }
 
     /// Returns the total quantity across all levels.
     pub fn total_quantity(&self) -> Quantity {
-        self.levels.values().map(|l| l.total_quantity()).sum()
+        self.levels.iter().map(|l| l.total_quantity()).sum()
     }
 
     /// Returns the total quantity available at prices that would cross with the given price.
@@ -194,74 +171,47 @@ impl PriceLevels {
     /// For bids: quantity at prices >= given price
     /// For asks: quantity at prices <= given price
     pub fn quantity_at_or_better(&self, price: Price) -> Quantity {
-        match self.side {
-            Side::Buy => {
-                // Bids: want prices >= given (higher is better for buyer)
-                self.levels
-                    .range(price..)
-                    .map(|(_, l)| l.total_quantity())
-                    .sum()
-            }
-            Side::Sell => {
-                // Asks: want prices <= given (lower is better for seller's counterparty)
-                self.levels
-                    .range(..=price)
-                    .map(|(_, l)| l.total_quantity())
-                    .sum()
-            }
-        }
+        let start = self
+            .levels
+            .partition_point(|l| self.is_worse(l.price(), price));
+        self.levels[start..]
+            .iter()
+            .map(|l| l.total_quantity())
+            .sum()
     }
 
     // === Private helpers ===
 
-    /// Recompute best price from scratch (O(1) for BTreeMap).
-    fn recompute_best_price(&mut self) {
-        self.best_price = match self.side {
-            Side::Buy => self.levels.keys().next_back().copied(), // Highest
-            Side::Sell => self.levels.keys().next().copied(),     // Lowest
-        };
+    /// True if `a` is strictly worse than `b` for this side (lower for
+    /// bids, higher for asks), i.e. `a` sorts before `b`.
+    #[inline]
+    fn is_worse(&self, a: Price, b: Price) -> bool {
+        match self.side {
+            Side::Buy => a < b,
+            Side::Sell => a > b,
+        }
     }
 
-    /// Update best price after inserting a new level.
-    fn update_best_price_after_insert(&mut self, new_price: Price) {
-        match self.best_price {
-            None => {
-                self.best_price = Some(new_price);
+    /// Binary search for `price`: `Ok(index)` if the level exists,
+    /// `Err(index)` with the insertion point otherwise.
+    ///
+    /// Scans the top of the book first, where nearly all activity lands.
+    #[inline]
+    fn find(&self, price: Price) -> Result<usize, usize> {
+        let len = self.levels.len();
+        if let Some(best) = self.levels.last() {
+            if best.price() == price {
+                return Ok(len - 1);
             }
-            Some(current_best) => {
-                let is_better = match self.side {
-                    Side::Buy => new_price > current_best, // Higher is better for bids
-                    Side::Sell => new_price < current_best, // Lower is better for asks
-                };
-                if is_better {
-                    self.best_price = Some(new_price);
-                }
+            if self.is_worse(best.price(), price) {
+                return Err(len);
             }
         }
-    }
-}
-
-/// Direction wrapper for the iterator.
-enum IterDirection<F, R> {
-    Forward(F),
-    Reverse(R),
-}
-
-type BTreeIter<'a> = std::collections::btree_map::Iter<'a, Price, Level>;
-
-/// Iterator that yields levels from best to worst price.
-struct BestToWorstIter<'a> {
-    inner: IterDirection<BTreeIter<'a>, std::iter::Rev<BTreeIter<'a>>>,
-}
-
-impl<'a> Iterator for BestToWorstIter<'a> {
-    type Item = (&'a Price, &'a Level);
-
-    fn next(&mut self) -> Option<Self::Item> {
-        match &mut self.inner {
-            IterDirection::Forward(iter) => iter.next(),
-            IterDirection::Reverse(iter) => iter.next(),
-        }
+        let side = self.side;
+        self.levels.binary_search_by(|l| match side {
+            Side::Buy => l.price().cmp(&price),
+            Side::Sell => price.cmp(&l.price()),
+        })
     }
 }
 
@@ -60,13 +60,10 @@ impl BookSnapshot {
     ///
     /// Returns `None` if the book is empty on both sides.
     pub fn imbalance(&self) -> Option<f64> {
-        let bid_qty = self.total_bid_quantity();
-        let ask_qty = self.total_ask_quantity();
-        let total = bid_qty + ask_qty;
-        if total == 0 {
-            return None;
-        }
-        Some((bid_qty as f64 - ask_qty as f64) / total as f64)
+        imbalance(
+            self.bids.iter().map(|l| l.quantity),
+            self.asks.iter().map(|l| l.quantity),
+        )
     }
 
     /// Volume-weighted midpoint price.
@@ -81,17 +78,48 @@ impl BookSnapshot {
     pub fn weighted_mid(&self) -> Option<f64> {
         let bid = self.bids.first()?;
         let ask = self.asks.first()?;
-        let total = bid.quantity + ask.quantity;
-        if total == 0 {
-            return None;
-        }
-        Some(
-            (ask.quantity as f64 * bid.price.0 as f64 + bid.quantity as f64 * ask.price.0 as f64)
-                / total as f64,
-        )
+        weighted_mid(bid.price, bid.quantity, ask.price, ask.quantity)
     }
 }
 
+/// `(bid_qty - ask_qty) / (bid_qty + ask_qty)` over the given level
+/// quantities, or `None` if both sides total 0.
+///
+/// Each side is accumulated in `f64`, so deep books with near-`u64::MAX`
+/// level totals cannot overflow either the side sums or the denominator.
+fn imbalance(
+    bid_qty: impl IntoIterator<Item = Quantity>,
+    ask_qty: impl IntoIterator<Item = Quantity>,
+) -> Option<f64> {
+    let bid: f64 = bid_qty.into_iter().map(|q| q as f64).sum();
+    let ask: f64 = ask_qty.into_iter().map(|q| q as f64).sum();
+    let total = bid + ask;
+    (total != 0.0).then(|| (bid - ask) / total)
+}
+
+/// Top-of-book midpoint weighted toward the thinner side.
+fn weighted_mid(
+    bid_price: Price,
+    bid_qty: Quantity,
+    ask_price: Price,
+    ask_qty: Quantity,
+) -> Option<f64> {
+    let (bid, ask) = (bid_qty as f64, ask_qty as f64);
+    let total = bid + ask;
+    (total != 0.0).then(|| (ask * bid_price.0 as f64 + bid * ask_price.0 as f64) / total)
+}
+
+/// Total quantity of each of the best `depth` levels, best first.
+fn depth_quantities(
+    levels: &crate::PriceLevels,
+    depth: usize,
+) -> impl Iterator<Item = Quantity> + '_ {
+    levels
+        .iter_best_to_worst()
+        .take(depth)
+        .map(|(_, level)| level.total_quantity())
+}
+
 /// A snapshot of a single price level.
 #[derive(Clone, Debug)]
 #[cfg_attr(feature = "serde", derive(serde::Serialize, serde::Deserialize))]
@@ -130,6 +158,27 @@ impl OrderBook {
     pub fn full_snapshot(&self) -> BookSnapshot {
         self.snapshot(usize::MAX)
     }
+
+    /// Same as `self.snapshot(depth).imbalance()`, read straight from the
+    /// price levels without building a snapshot.
+    pub fn imbalance(&self, depth: usize) -> Option<f64> {
+        imbalance(
+            depth_quantities(self.bids(), depth),
+            depth_quantities(self.asks(), depth),
+        )
+    }
+
+    /// Same as `self.snapshot(1).weighted_mid()`, without allocating.
+    pub fn weighted_mid(&self) -> Option<f64> {
+        let bid = self.bids().best_level()?;
+        let ask = self.asks().best_level()?;
+        weighted_mid(
+            bid.price,
+            bid.total_quantity(),
+            ask.price,
+            ask.total_quantity(),
+        )
+    }
 }
 
 #[cfg(test)]
@@ -298,4 +347,57 @@ mod tests {
         let snap = book.snapshot(10);
         assert!(snap.weighted_mid().is_none());
     }
+
+    #[test]
+    fn book_analytics_match_snapshot() {
+        let mut book = OrderBook::new();
+        for i in 0..5 {
+            let b = book.create_order(
+                Side::Buy,
+                Price(100_00 - i * 100),
+                100 + i as u64 * 10,
+                TimeInForce::GTC,
+            );
+            let a = book.create_order(
+                Side::Sell,
+                Price(101_00 + i * 100),
+                300 - i as u64 * 40,
+                TimeInForce::GTC,
+            );
+            book.add_order(b);
+            book.add_order(a);
+        }
+        for depth in [0, 1, 3, 10] {
+            assert_eq!(book.imbalance(depth), book.snapshot(depth).imbalance());
+        }
+        assert_eq!(book.weighted_mid(), book.snapshot(1).weighted_mid());
+
+        let empty = OrderBook::new();
+        assert!(empty.imbalance(10).is_none());
+        assert!(empty.weighted_mid().is_none());
+    }
+
+    #[test]
+    fn imbalance_does_not_overflow() {
+        assert_eq!(imbalance([u64::MAX], [u64::MAX]), Some(0.0));
+        assert_eq!(imbalance([u64::MAX], []), Some(1.0));
+        // The per-side sums would overflow u64 as well.
+        assert_eq!(
+            imbalance([u64::MAX, u64::MAX], [u64::MAX, u64::MAX]),
+            Some(0.0)
+        );
+    }
+
+    #[test]
+    fn book_imbalance_deep_levels_do_not_overflow() {
+        let mut book = OrderBook::new();
+        for i in 0..2 {
+            let b = book.create_order(Side::Buy, Price(100_00 - i), u64::MAX, TimeInForce::GTC);
+            let a = book.create_order(Side::Sell, Price(101_00 + i), u64::MAX, TimeInForce::GTC);
+            book.add_order(b);
+            book.add_order(a);
+        }
+        assert_eq!(book.imbalance(2), Some(0.0));
+        assert_eq!(book.snapshot(2).imbalance(), Some(0.0));
+    }
 }
@@ -6,8 +6,11 @@ use std::fmt;
 ///
 /// `Price(10050)` represents $100.50 if tick size is $0.01.
 /// Using fixed-point avoids floating-point errors in financial calculations.
+///
+/// `repr(transparent)`: a `Price` has exactly the layout of an `i64`.
 #[derive(Clone, Copy, Debug, Default, PartialEq, Eq, PartialOrd, Ord, Hash)]
 #[cfg_attr(feature = "serde", derive(serde::Serialize, serde::Deserialize))]
+#[repr(transparent)]
 pub struct Price(pub i64);
 
 impl Price {
@@ -172,6 +175,12 @@ mod tests {
         assert_eq!(Price(100), Price(100));
     }
 
+    #[test]
+    fn price_has_i64_layout() {
+        assert_eq!(std::mem::size_of::<Price>(), std::mem::size_of::<i64>());
+        assert_eq!(std::mem::align_of::<Price>(), std::mem::align_of::<i64>());
+    }
+
     #[test]
     fn price_display() {
         assert_eq!(format!("{}", Price(10050)), "$100.50");